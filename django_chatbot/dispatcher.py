@@ -38,60 +38,131 @@
 
 import importlib
 import logging
-from typing import Dict, Iterable, List
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
+from django_chatbot.conf import settings
 from django_chatbot.forms import FormRepository
-from django_chatbot.handlers import Handler
+from django_chatbot.handlers import CommandHandler, Handler
 from django_chatbot.models import Bot, Form, Update
 from django_chatbot.telegram.types import Update as TelegramUpdate
 
 log = logging.getLogger(__name__)
 
 
-def load_handlers() -> Dict[str, List[Handler]]:
-    """Load registered handlers for all bots
+@lru_cache(maxsize=settings.DJANGO_CHATBOT["LOAD_HANDLERS_CACHE_SIZE"])
+def _load_bot_handlers(module_name: str) -> Sequence[Handler]:
+    """Return handler for a bot.
+
+    django_chatbot loads the module and looks for the variable `handlers`.
+    This should be a tuple (or a list) of `Handler` instances.
+
+    Args:
+        module_name: Full module name where to search handlers.
 
     Returns:
-        dictionary like
-        {'first_bot_token':[Handler_1, Handler_2 ... ]
+        sequence of `Handler`
 
     """
-    handlers = {}
-    for bot in Bot.objects.all():
-        handlers[bot.token_slug] = _load_bot_handlers(bot.root_handlerconf)
-        log.info(
-            "Handlers %s for bot %s has been loaded",
-            bot.root_handlerconf,
-            bot.name,
-        )
-    return handlers
+    module = importlib.import_module(module_name)
+    log.info("Handlers %s have been loaded", module_name)
+    return module.handlers  # noqa
 
 
-def _load_bot_handlers(module_name: str) -> List[Handler]:
-    """Return handler for a bot.
+class _HandlerIndex:
+    """Handlers of a bot prepared for matching.
 
-    django_chatbot loads the module and looks for the variable `handlers`.
-    This should be a list of `Handler` instances.
+    Plain `CommandHandler` instances are looked up by command in a dictionary,
+    other handlers are matched one by one. The registration order is kept:
+    a handler registered before the found command handler still takes
+    precedence over it.
 
     Args:
-        module_name: Full module name where to search handlers.
+        handlers: The handlers to index.
+
+    """
+
+    def __init__(self, handlers: Iterable[Handler]):
+        self.commands: Dict[str, Tuple[int, Handler]] = {}
+        self.others: List[Tuple[int, Handler]] = []
+        position = -1
+        for position, handler in enumerate(handlers):
+            if (
+                isinstance(handler, CommandHandler)
+                and type(handler).match is CommandHandler.match
+            ):
+                self.commands.setdefault(handler.command, (position, handler))
+            else:
+                self.others.append((position, handler))
+        self.size = position + 1
+
+    def find(self, update: Update) -> Optional[Handler]:
+        """Return the first handler matching the update."""
+        position, found = self.size, None
+        if self.commands:
+            for command in self._get_commands(update):
+                hit = self.commands.get(command)
+                if hit and hit[0] < position:
+                    position, found = hit
+        for other_position, handler in self.others:
+            if other_position > position:
+                break
+            if handler.match(update=update):
+                return handler
+        return found
+
+    @staticmethod
+    def _get_commands(update: Update) -> List[str]:
+        message = update.message
+        if message and message.entities:
+            return [
+                entity.text
+                for entity in message.entities
+                if entity.type == "bot_command"
+            ]
+        return []
+
+
+# token slug -> (handlers, handler index, suppress form handler index)
+_handler_indexes: Dict[str, Tuple[Sequence[Handler], _HandlerIndex, _HandlerIndex]] = {}
+
+
+def _get_handler_indexes(
+    token_slug: str, handlers: Sequence[Handler]
+) -> Tuple[_HandlerIndex, _HandlerIndex]:
+    """Return the indexes of the bot handlers.
+
+    The indexes are built once and reused while the bot has the same
+    handlers, so a dispatcher created for every update doesn't rebuild them.
+
+    Args:
+        token_slug: The bot token slug.
+        handlers: The handlers registered to the bot.
 
     Returns:
-        list of `Handler`
+        The handler index and the index of the handlers suppressing forms.
 
     """
-    module = importlib.import_module(module_name)
-    return module.handlers  # noqa
+    cached = _handler_indexes.get(token_slug)
+    if cached is None or cached[0] is not handlers:
+        cached = (
+            handlers,
+            _HandlerIndex(handlers),
+            _HandlerIndex([h for h in handlers if h.suppress_form]),
+        )
+        _handler_indexes[token_slug] = cached
+    return cached[1], cached[2]
 
 
 class Dispatcher:
     """This class dispatches incoming Telegram updates.
 
-    Dispatcher iterates all registered handlers until the handler matches
+    Dispatcher looks for the first registered handler that matches
     the update. Then Dispatcher calls the handler `handle_update` method.
+    Command handlers are found by the command without calling their `match`.
 
     Note: To register handlers for a bot, add some module that contains
-        the `handlers` variable. This should be a list of `Handler` instances.
+        the `handlers` variable. This should be a tuple of `Handler` instances.
         Then add the module name to bot 'ROOT_HANDLERCONF' setting.
 
     Attributes:
@@ -115,7 +186,12 @@ class Dispatcher:
             self.bot = Bot.objects.get(token_slug=token_slug)
         else:
             raise ValueError("token_slug or bot is required")
-        self.handlers = load_handlers()[self.bot.token_slug]
+        # The bot is read from the database, so a handlerconf changed
+        # by another process is picked up by the next dispatch.
+        self.handlers = _load_bot_handlers(self.bot.root_handlerconf)
+        self._handler_index, self._suppress_form_index = _get_handler_indexes(
+            self.bot.token_slug, self.handlers
+        )
 
     def dispatch(self, update_data: dict):
         """Dispatch incoming Telegram updates"""
@@ -124,26 +200,25 @@ class Dispatcher:
         )
         if form_model := Form.objects.get_form(update):
             if not self._check_handlers(
-                update=update, handlers=[h for h in self.handlers if h.suppress_form]
+                update=update, handler_index=self._suppress_form_index
             ):
                 FormRepository(update=update, form_model=form_model).handle_update()
         else:
-            self._check_handlers(update, self.handlers)
+            self._check_handlers(update, self._handler_index)
 
     @staticmethod
-    def _check_handlers(update: Update, handlers: Iterable[Handler]) -> bool:
+    def _check_handlers(update: Update, handler_index: _HandlerIndex) -> bool:
         """Check if one of the handlers match the update
 
         Args:
             update: The update to check.
-            handlers: The handlers to check.
+            handler_index: The indexed handlers to check.
 
         Returns:
             True if one of the handlers match the update.
 
         """
-        for handler in handlers:
-            if handler.match(update=update):
-                handler.handle_update(update=update)
-                return True
+        if handler := handler_index.find(update):
+            handler.handle_update(update=update)
+            return True
         return False
@@ -27,6 +27,11 @@ from enum import Enum
 from typing import Callable, Literal
 
 
+def _always(*args, **kwargs):
+    """Default condition of a next field, the field is always reachable."""
+    return True
+
+
 class PromptType(Enum):
     NEW_MESSAGE = "new_message"
     UPDATE_MESSAGE = "update_message"
@@ -69,6 +74,17 @@ class Field:
         self.prompt_type = PromptType.NEW_MESSAGE
         self._next_fields = []  # list of tuple (field, condition, prompt_type)
 
+    def __copy__(self):
+        """Return a new field with the same configuration.
+
+        The configuration (prompt, keyboard, validators) is shared with
+        the original field, the list of next fields is not.
+        """
+        field = self.__class__.__new__(self.__class__)
+        field.__dict__.update(self.__dict__)
+        field._next_fields = list(self._next_fields)
+        return field
+
     def input(self, value, form):
         """
 
@@ -151,7 +167,7 @@ class Field:
                 Defaults to PromptType.NEW_MESSAGE.
         """
         if condition is None:
-            condition = lambda *args, **kwargs: True
+            condition = _always
         self._next_fields.append((field, condition, prompt_type))
 
     def add_next_fields(self, *fields):
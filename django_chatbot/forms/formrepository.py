@@ -21,7 +21,11 @@
 #  ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR
 #  THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 # *****************************************************************************
+import copy
 import importlib
+from functools import lru_cache
+
+from django.utils import timezone
 
 from django_chatbot import models
 from django_chatbot.telegram.types import InlineKeyboardMarkup
@@ -43,6 +47,9 @@ class FormRepository:
         self.prompt_message = None
         self.form_model = form_model
         self.handler = handler
+        # Form and field states as they are stored in the database
+        self._stored_form = {}
+        self._stored_fields = {}
 
         if form_model:
             self.is_started = True
@@ -74,12 +81,17 @@ class FormRepository:
     def save_form(self, form):
         if self.form_model:
             form_model = self.form_model
-            form_model.current_field = (
-                form.current_field.name if form.current_field else None
-            )
-            form_model.context = form.context
-            form_model.is_finished = form.is_finished
-            form_model.save()
+            state = self._get_form_state(form)
+            changed_fields = [
+                name
+                for name, value in state.items()
+                if self._stored_form.get(name) != value
+            ]
+            if changed_fields:
+                for name in changed_fields:
+                    setattr(form_model, name, state[name])
+                form_model.save(update_fields=changed_fields + ["updated_at"])
+                self._stored_form = copy.deepcopy(state)
         else:
             form_model = models.Form.objects.create(
                 module_name=form.__module__,
@@ -89,9 +101,28 @@ class FormRepository:
                 is_finished=form.is_finished,
                 handler=self.handler.name,
             )
+            self.form_model = form_model
+            self._stored_form = copy.deepcopy(self._get_form_state(form))
+            # A new form has no stored fields, so all of them are inserted at once
+            models.Field.objects.bulk_create(
+                models.Field(
+                    form=form_model,
+                    name=field.name,
+                    value=field.value,
+                    is_valid=field.is_valid,
+                )
+                for field in form.fields.values()
+            )
+            self._stored_fields = {
+                field.name: (field.value, field.is_valid)
+                for field in form.fields.values()
+            }
 
         for field in form.fields.values():
-            self._save_field(field, form_model)
+            state = (field.value, field.is_valid)
+            if self._stored_fields.get(field.name) != state:
+                self._save_field(field, form_model)
+                self._stored_fields[field.name] = state
 
         self.update.set_handler(form_model.handler)
         self.input_telegram_object.set_form(form_model)
@@ -100,20 +131,25 @@ class FormRepository:
 
         return form_model
 
+    @staticmethod
+    def _get_form_state(form):
+        return {
+            "current_field": form.current_field.name if form.current_field else None,
+            "context": form.context,
+            "is_finished": form.is_finished,
+        }
+
     @staticmethod
     def _save_field(field, form_model):
-        models.Field.objects.update_or_create(
-            form=form_model,
-            name=field.name,
-            defaults={
-                "value": field.value,
-                "is_valid": field.is_valid,
-            },
-        )
+        # Single UPDATE for the existing field instead of SELECT + UPDATE
+        values = {"value": field.value, "is_valid": field.is_valid}
+        if not models.Field.objects.filter(form=form_model, name=field.name).update(
+            updated_at=timezone.now(), **values
+        ):
+            models.Field.objects.create(form=form_model, name=field.name, **values)
 
     def _load_form(self, form_model):
-        module = importlib.import_module(form_model.module_name)
-        klass = getattr(module, form_model.class_name)
+        klass = _get_form_class(form_model.module_name, form_model.class_name)
         form = klass(repository=self)
         form.context = form_model.context
         form.is_finished = form_model.is_finished
@@ -123,8 +159,21 @@ class FormRepository:
             else None
         )
 
-        for field_model in models.Field.objects.filter(form=form_model):
+        self._stored_form = {
+            "current_field": form_model.current_field or None,
+            "context": copy.deepcopy(form_model.context),
+            "is_finished": form_model.is_finished,
+        }
+
+        field_models = models.Field.objects.filter(form=form_model).only(
+            "name", "value", "is_valid"
+        )
+        for field_model in field_models:
             self._load_field(form, field_model)
+            self._stored_fields[field_model.name] = (
+                field_model.value,
+                field_model.is_valid,
+            )
 
         return form
 
@@ -133,3 +182,10 @@ class FormRepository:
         field = getattr(form, field_model.name)
         field.value = field_model.value
         field.is_valid = field_model.is_valid
+
+
+@lru_cache(maxsize=None)
+def _get_form_class(module_name, class_name):
+    """Return the form class stored in the form model."""
+    module = importlib.import_module(module_name)
+    return getattr(module, class_name)
@@ -22,6 +22,7 @@
 #  THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 # *****************************************************************************
 import copy
+from typing import Dict
 
 from .fields import Field
 
@@ -37,16 +38,30 @@ class Form:
         self._prepare_fields()
         self.connect_fields()
 
+    @classmethod
+    def _get_declared_fields(cls) -> Dict[str, Field]:
+        """Return the fields declared as the class variables.
+
+        The class is scanned once, the result is cached on the class.
+        """
+        if "_declared_fields" not in cls.__dict__:
+            cls._declared_fields = {
+                attr: class_field
+                for attr in dir(cls)
+                if isinstance(class_field := getattr(cls, attr), Field)
+            }
+        return cls._declared_fields
+
     def _prepare_fields(self):
         """Prepare the form fields.
         Makes instance field variables of the class variables.
+        Class variables are never mutated, every form gets its own copies.
         """
-        for attr in dir(self.__class__):
-            if isinstance(class_field := getattr(self.__class__, attr), Field):
-                field = copy.deepcopy(class_field)
-                field.name = attr
-                setattr(self, attr, field)
-                self.fields[attr] = field
+        for attr, class_field in self._get_declared_fields().items():
+            field = copy.copy(class_field)
+            field.name = attr
+            setattr(self, attr, field)
+            self.fields[attr] = field
 
     def get_root_field(self) -> Field:
         """Return root field"""
@@ -48,6 +48,15 @@ class Handler(ABC):
 
     """
 
+    __slots__ = (
+        "name",
+        "callback",
+        "async_callback",
+        "form_class",
+        "form",
+        "suppress_form",
+    )
+
     def __init__(
         self,
         name: str,
@@ -105,6 +114,8 @@ class DefaultHandler(Handler):
 
     """
 
+    __slots__ = ()
+
     def match(self, update: Update) -> bool:
         return True
 
@@ -121,18 +132,19 @@ class CommandHandler(Handler):
 
     """
 
+    __slots__ = ("command",)
+
     def __init__(self, *args, command, **kwargs):
         self.command = command
         super().__init__(*args, **kwargs)
 
     def match(self, update: Update) -> bool:
-        match = False
         message = update.message
         if message and message.entities:
-            if [
-                entity
+            command = self.command
+            # Stop at the first matching command entity
+            return any(
+                entity.type == "bot_command" and entity.text == command
                 for entity in message.entities
-                if entity.type == "bot_command" and entity.text == self.command
-            ]:
-                match = True
-        return match
+            )
+        return False
@@ -25,7 +25,7 @@ import logging
 from typing import TYPE_CHECKING
 
 from django.apps import apps
-from django.db import models
+from django.db import IntegrityError, models, transaction
 from django.dispatch import Signal
 
 logger = logging.getLogger(__name__)
@@ -46,8 +46,8 @@ class UserManager(models.Manager):
     def from_telegram(self, telegram_user: "types.User") -> "User":
         defaults = telegram_user.to_dict()
         defaults.pop("id")
-        user, created = self.update_or_create(
-            user_id=telegram_user.id, defaults=defaults
+        user, created = _update_or_create(
+            self, user_id=telegram_user.id, defaults=defaults
         )
 
         telegram_instance.send(sender=self.model, created=created, instance=user)
@@ -71,9 +71,12 @@ class ChatManager(models.Manager):
         _update_defaults(telegram_chat, defaults, "permissions")
         _update_defaults(telegram_chat, defaults, "location")
         defaults.pop("id")
-        chat, created = self.update_or_create(
-            chat_id=telegram_chat.id, bot=bot, defaults=defaults
+        chat, created = _update_or_create(
+            self, chat_id=telegram_chat.id, bot=bot, defaults=defaults
         )
+        # An existing chat is fetched without its bot; reuse the known
+        # instance so replying to the chat doesn't query the bot again.
+        chat.bot = bot
 
         telegram_instance.send(sender=self.model, created=created, instance=chat)
 
@@ -82,18 +85,27 @@ class ChatManager(models.Manager):
 
 class FormManager(models.Manager):
     def get_form(self, update: "types.Update"):
+        """Return the unfinished form the update answers, if there is one.
 
+        The form is selected by a single query, and a finished form is filtered
+        out by the database.
+        """
         if message := update.message:
-            try:
-                previous = message.get_previous_by_date(chat_id=message.chat_id)
-            except apps.get_model("django_chatbot", "Message").DoesNotExist:
-                return None
-            else:
-                if previous.form and not previous.form.is_finished:
-                    return previous.form
+            Message = apps.get_model("django_chatbot", "Message")
+            # Same lookup as `message.get_previous_by_date()`
+            previous = (
+                Message.objects.filter(chat_id=message.chat_id)
+                .filter(
+                    models.Q(date__lt=message.date)
+                    | models.Q(date=message.date, pk__lt=message.pk)
+                )
+                .order_by("-date", "-pk")
+                .values("form")[:1]
+            )
+            return self.filter(pk=models.Subquery(previous), is_finished=False).first()
         elif callback_query := update.callback_query:
-            if callback_query.form and not callback_query.form.is_finished:
-                return callback_query.form
+            if form_id := callback_query.message.form_id:
+                return self.filter(pk=form_id, is_finished=False).first()
         return None
 
 
@@ -146,9 +158,16 @@ class MessageManager(models.Manager):
         if telegram_message.from_user:
             user = User.objects.from_telegram(telegram_message.from_user)
             defaults["from_user"] = user
-        if telegram_message.reply_to_message:
-            defaults["reply_to_message"] = self.get_message(
-                telegram_message.reply_to_message
+        if reply_to_message := telegram_message.reply_to_message:
+            # Only the key of the replied message is needed, not its columns
+            defaults.pop("reply_to_message")
+            defaults["reply_to_message_id"] = (
+                self.filter(
+                    message_id=reply_to_message.message_id,
+                    chat__chat_id=reply_to_message.chat.id,
+                )
+                .values_list("pk", flat=True)
+                .first()
             )
         if telegram_message.left_chat_member:
             user = User.objects.from_telegram(telegram_message.left_chat_member)
@@ -180,8 +199,8 @@ class MessageManager(models.Manager):
                 User.objects.from_telegram(telegram_user)
                 for telegram_user in telegram_message.new_chat_members
             ]
-            for member in members:
-                message.new_chat_members.add(member)
+            # One query for the existing links and one INSERT for the new ones
+            message.new_chat_members.add(*members)
         return message
 
     def get_message(self, telegram_message: "types.Message") -> "Message":
@@ -252,9 +271,13 @@ class UpdateManager(models.Manager):
         elif telegram_update.callback_query:
             return Update.TYPE_CALLBACK_QUERY
 
+    @transaction.atomic
     def from_telegram(self, bot: "Bot", telegram_update: "types.Update") -> "Update":
         """Create a model instance from a telegram type instance.
 
+        The update and all related users, chats and messages are saved in
+        a single transaction.
+
         Args:
             bot: The bot the chat belongs to.
             telegram_update: Telegram Update.
@@ -308,3 +331,40 @@ def _update_defaults(telegram_object: object, defaults: dict, attr: str):
     if getattr(telegram_object, attr):
         defaults[f"_{attr}"] = defaults[attr]
         defaults.pop(attr)
+
+
+def _update_or_create(manager: models.Manager, defaults: dict, **kwargs):
+    """Same as ``update_or_create``, but an unchanged record is not saved.
+
+    Only the changed fields of an existing record are updated. Unlike
+    ``update_or_create``, the existing record is not locked with
+    ``select_for_update``, so concurrent writers resolve by last write wins.
+
+    Returns:
+        Tuple of the model instance and a flag whether it was created.
+    """
+    try:
+        obj = manager.get(**kwargs)
+    except manager.model.DoesNotExist:
+        try:
+            with transaction.atomic():
+                return manager.create(**kwargs, **defaults), True
+        except IntegrityError:
+            # The record has been created by a concurrent writer
+            obj = manager.get(**kwargs)
+
+    changed_fields = []
+    for field in obj._meta.concrete_fields:
+        if field.name not in defaults:
+            continue
+        value = defaults[field.name]
+        if field.is_relation:
+            current, new = getattr(obj, field.attname), getattr(value, "pk", value)
+        else:
+            current, new = getattr(obj, field.name), value
+        if current != new:
+            setattr(obj, field.name, value)
+            changed_fields.append(field.name)
+    if changed_fields:
+        obj.save(update_fields=changed_fields)
+    return obj, False
@@ -0,0 +1,17 @@
+# Generated by Django 3.2.13 on 2026-10-17 12:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_chatbot', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(fields=['chat', 'date'], name='django_chat_chat_id_e9864d_idx'),
+        ),
+    ]
@@ -549,9 +549,13 @@ class Message(models.Model):
         ordering = ["message_id", "chat"]
         unique_together = ["message_id", "chat"]
         index_together = ["message_id", "chat"]
+        indexes = [
+            # Previous message lookup in `FormManager.get_form`
+            models.Index(fields=["chat", "date"]),
+        ]
 
     def __str__(self):
-        return self.text[0:20]
+        return (self.text or "")[0:20]
 
     @cached_property
     def bot(self):
@@ -696,8 +700,11 @@ class Message(models.Model):
         return message
 
     def set_form(self, form: Form):
+        if self.form_id is not None and self.form_id == form.pk:
+            return
         self.form = form
-        self.save()
+        # Only the form column, the JSON columns are not encoded again
+        self.save(update_fields=["form"] if self.pk is not None else None)
 
     def edit_reply_markup(self, reply_markup: types.InlineKeyboardMarkup):
         api = self.bot.api
@@ -764,8 +771,7 @@ class CallbackQuery(models.Model):
         return self.message.form
 
     def set_form(self, form: Form):
-        self.message.form = form
-        self.message.save()
+        self.message.set_form(form)
 
 
 class Update(models.Model):
@@ -783,6 +789,14 @@ class Update(models.Model):
         (TYPE_EDITED_CHANNEL_POST, "Edited channel post"),
         (TYPE_CALLBACK_QUERY, "Callback query"),
     )
+    MESSAGE_TYPES = frozenset(
+        {
+            TYPE_MESSAGE,
+            TYPE_EDITED_MESSAGE,
+            TYPE_CHANNEL_POST,
+            TYPE_EDITED_CHANNEL_POST,
+        }
+    )
 
     bot = models.ForeignKey(Bot, on_delete=models.CASCADE)
     handler = models.CharField(max_length=100, blank=True)
@@ -808,20 +822,17 @@ class Update(models.Model):
 
     @property
     def telegram_object(self):
-        if self.type in [
-            self.TYPE_MESSAGE,
-            self.TYPE_EDITED_MESSAGE,
-            self.TYPE_CHANNEL_POST,
-            self.TYPE_EDITED_CHANNEL_POST,
-        ]:
+        if self.type in self.MESSAGE_TYPES:
             return self.message
         elif self.type == self.TYPE_CALLBACK_QUERY:
             return self.callback_query
 
     def set_handler(self, handler: str):
         """Set the handler for this update."""
+        if self.pk is not None and self.handler == handler:
+            return
         self.handler = handler
-        self.save()
+        self.save(update_fields=["handler"] if self.pk is not None else None)
 
 
 def _update_defaults(telegram_object: object, defaults: dict, attr: str):
@@ -25,11 +25,12 @@
 """This module contains classes for Telegram bot API"""
 import json
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import List, Type, Union
 
 import requests
 from django.utils.timezone import datetime
+from requests.adapters import HTTPAdapter
 
 from .types import (
     BotCommand,
@@ -93,10 +94,19 @@ from .types import (
     WebhookInfo,
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 log = logging.getLogger(__name__)
 
 SERVER_URL = "https://api.telegram.org"
 
+# Shared session keeps connections to Telegram alive between API calls
+_SESSION = requests.Session()
+_SESSION.mount(SERVER_URL, HTTPAdapter(pool_connections=16, pool_maxsize=64))
+
 
 class TelegramError(Exception):
     """Telegram error
@@ -143,6 +153,36 @@ class TelegramError(Exception):
         }
 
 
+def _dumps(obj) -> str:
+    """Encode the API method parameter to JSON.
+
+    ``orjson`` is used if it is installed. It encodes telegram types directly,
+    without building the intermediate ``to_dict()`` dictionaries.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            default=_orjson_default,
+            option=orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME,
+        ).decode()
+    if isinstance(obj, TelegramType):
+        obj = obj.to_dict(date_as_timestamp=True)
+    return json.dumps(obj)
+
+
+def _orjson_default(obj):
+    """Encode the objects orjson is told to pass through, like ``to_dict()``."""
+    if isinstance(obj, TelegramType):
+        return {
+            field.name: value
+            for field in fields(obj)
+            if (value := getattr(obj, field.name)) is not None
+        }
+    if isinstance(obj, datetime):
+        return TelegramType.datetime_to_timestamp(obj)
+    raise TypeError
+
+
 @dataclass
 class _Binder:
     """Helper class for communicating with Telegram Bot API.
@@ -177,38 +217,50 @@ class _Binder:
             TelegramError: If there is telegram or requests error.
         """
         if self.params:
-            params = {k: v for k, v in self.params.items() if v is not None}
-            response = requests.post(url=self.url, data=params)
-            log.debug(
-                "Telegram response",
-                extra={
-                    "params": params,
-                    "response_url": response.url,
-                    "response_status_code": response.status_code,
-                    "response_json": response.json(),
-                },
-            )
+            params = self.params
+            if None in params.values():
+                params = {k: v for k, v in params.items() if v is not None}
+            response = _SESSION.post(url=self.url, data=params)
         else:
-            response = requests.get(url=self.url)
-            log.debug(
-                "Telegram response",
-                extra={
-                    "response_url": response.url,
-                    "response_status_code": response.status_code,
-                    "response_json": response.json(),
-                },
-            )
-        result = self._parse_response(response, self.telegram_type, self.many)
+            params = None
+            response = _SESSION.get(url=self.url)
+        response_json = self._load_json(response)
+        log.debug(
+            "Telegram response",
+            extra={
+                "params": params,
+                "response_url": response.url,
+                "response_status_code": response.status_code,
+                "response_json": response_json,
+            },
+        )
+        result = self._parse_response(
+            response, response_json, self.telegram_type, self.many
+        )
         return result
 
+    @staticmethod
+    def _load_json(response: requests.Response):
+        """Decode JSON body of the response.
+
+        ``orjson`` is used if it is installed.
+        """
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+
     @staticmethod
     def _parse_response(
-        response: requests.Response, telegram_type: Type[TelegramType], many: bool
+        response: requests.Response,
+        response_json: dict,
+        telegram_type: Type[TelegramType],
+        many: bool,
     ):
         """Parse response
 
         Args:
             response: requests response object.
+            response_json: Decoded JSON body of the response.
             telegram_type: Type to which should be casted.
 
         Returns:
@@ -218,11 +270,9 @@ class _Binder:
             TelegramError: If there was telegram or requests error.
         """
         if response.status_code == 200:
-            response_result = response.json()
-            result = _Binder._get_result(response_result, telegram_type, many)
+            result = _Binder._get_result(response_json, telegram_type, many)
             return result
         else:
-            response_json = response.json()
             raise TelegramError(
                 reason=response_json["description"],
                 url=response.url,
@@ -555,7 +605,7 @@ class Api:
         if entities is not None:
             entities = [e.to_dict() for e in entities]
         if reply_markup is not None:
-            reply_markup = json.dumps(reply_markup.to_dict())
+            reply_markup = _dumps(reply_markup)
 
         params = {
             "chat_id": chat_id,
@@ -2771,7 +2821,7 @@ class Api:
         if entities is not None:
             entities = [e.to_dict() for e in entities]
         if reply_markup is not None:
-            reply_markup = json.dumps(reply_markup.to_dict())
+            reply_markup = _dumps(reply_markup)
 
         params = {
             "text": text,
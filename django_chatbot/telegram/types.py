@@ -25,17 +25,44 @@
 """Contains telegram types"""
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
-from typing import Any, Callable, List, Union
+import sys
+import threading
+from dataclasses import MISSING, asdict, dataclass, fields
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    List,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
 
-import dacite
 from django.utils import timezone
 from django.utils.timezone import datetime
 
+_UTC = timezone.utc
+
+# The telegram types defined in this module: {name: class}
+_TELEGRAM_TYPES = {}
+
+
+class TelegramTypeError(Exception):
+    """The source dictionary doesn't match the telegram type"""
+
 
 class TelegramType:
     """Base class for telegram types"""
 
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.__module__ == __name__:
+            _TELEGRAM_TYPES[cls.__name__] = cls
+
     @classmethod
     def from_dict(cls, source: dict):
         """Create TelegramType from response dict
@@ -46,11 +73,13 @@ class TelegramType:
         Returns:
             TelegramType
 
+        Raises:
+            TelegramTypeError: If a required field is missing or a scalar
+                field has a value of a wrong type.
+
         """
-        source = TelegramType.convert_date(source, TelegramType.timestamp_to_datetime)
-        source = TelegramType.convert_froms(source)
-        o = dacite.from_dict(cls, source)
-        return o
+        # Dates and "from" keys are converted by the builder in the same pass
+        return _build(cls, source)
 
     @staticmethod
     def convert_date(source: dict, convertor: Callable[[Any], Any]):
@@ -70,18 +99,13 @@ class TelegramType:
         for k, v in source.items():
             if isinstance(v, dict):
                 v = TelegramType.convert_froms(v)
-            if k == "from":
-                converted["from_user"] = v
-            else:
-                converted[k] = v
+            converted[_TELEGRAM_RENAMES.get(k, k)] = v
         return converted
 
     @staticmethod
     def timestamp_to_datetime(timestamp: int) -> timezone.datetime:
         """Convert timestamp to datetime"""
-        dt = timezone.datetime.fromtimestamp(timestamp)
-        dt = timezone.make_aware(dt, timezone=timezone.utc)
-        return dt
+        return datetime.fromtimestamp(timestamp, _UTC)
 
     @staticmethod
     def datetime_to_timestamp(datetime: timezone.datetime) -> float:
@@ -89,14 +113,242 @@ class TelegramType:
         return datetime.timestamp()
 
     def to_dict(self, date_as_timestamp=False):
-        dikt = asdict(
-            self, dict_factory=lambda l: {k: v for k, v in l if v is not None}
-        )
+        # None fields are dropped and dates converted while the dict is built
         if date_as_timestamp:
-            dikt = TelegramType.convert_date(dikt, TelegramType.datetime_to_timestamp)
-        return dikt
+            return asdict(self, dict_factory=_dict_with_timestamps)
+        return asdict(self, dict_factory=_dict_without_none)
+
+
+def _dict_without_none(items: List[Tuple[str, Any]]) -> dict:
+    return {k: v for k, v in items if v is not None}
+
+
+def _dict_with_timestamps(items: List[Tuple[str, Any]]) -> dict:
+    return {
+        k: v.timestamp() if isinstance(v, datetime) else v
+        for k, v in items
+        if v is not None
+    }
+
+
+def _slotted(cls: type) -> type:
+    """Recreate the dataclass with ``__slots__``.
+
+    Same as ``dataclass(slots=True)``, which is available since Python 3.10.
+    Used for the types created for every incoming update.
+    """
+    field_names = tuple(field.name for field in fields(cls))
+    cls_dict = dict(cls.__dict__)
+    for name in field_names:
+        # Default values are kept by the generated __init__
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    cls_dict["__slots__"] = field_names
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
+@lru_cache(maxsize=None)
+def _get_fields(cls: type) -> Tuple[Tuple[str, Any], ...]:
+    """Return the fields of the dataclass with their types.
+
+    Type hints are resolved only once per class.
+    """
+    hints = get_type_hints(cls, localns=_TELEGRAM_TYPES)
+    return tuple((field.name, hints[field.name]) for field in fields(cls))
+
+
+@lru_cache(maxsize=None)
+def _get_required_fields(cls: type) -> frozenset:
+    """Return the names of the dataclass fields without default values."""
+    return frozenset(
+        field.name
+        for field in fields(cls)
+        if field.default is MISSING and field.default_factory is MISSING
+    )
+
+
+# Telegram keys which are not valid field names: {telegram key: field name}
+_TELEGRAM_RENAMES = {"from": "from_user"}
+# Keys a field is read from, the telegram key first: {field name: source keys}
+_SOURCE_KEYS = {
+    field_name: (key, field_name) for key, field_name in _TELEGRAM_RENAMES.items()
+}
+
+# Enum-like string fields, their values are repeated in every update
+_INTERNED_FIELDS = frozenset({"type", "language_code", "parse_mode"})
+
+# Accepted source value types of the scalar fields: {field type: value types}
+_SCALAR_TYPES = {str: str, int: int, bool: bool, float: (int, float)}
+
+# Generated builders: {TelegramType subclass: build function}
+_builders = {}
+_builders_lock = threading.Lock()
+
+
+def _get_builder(cls: type) -> Callable[[dict], Any]:
+    """Return the function creating the dataclass from the source dictionary.
+
+    The function is generated on first use, because the annotations can't be
+    resolved before all the types are defined.
+    """
+    try:
+        return _builders[cls]
+    except KeyError:
+        with _builders_lock:
+            pending = {}
+            build = _generate_builder(cls, pending)
+            # Published only when the builders of all nested types are bound
+            _builders.update(pending)
+            return build
+
+
+def _generate_builder(cls: type, pending: dict) -> Callable[[dict], Any]:
+    """Generate the function creating the dataclass from the source dictionary.
+
+    The function is specialized for the class: field names are literals, dates
+    and lists are converted inline and the builders of nested types are called
+    directly.
+
+    Args:
+        cls: The dataclass.
+        pending: Builders generated, but not published yet.
+    """
+    if cls in _builders:
+        return _builders[cls]
+    if cls in pending:
+        return pending[cls]
+
+    namespace = {
+        "cls": cls,
+        "intern": sys.intern,
+        "fromtimestamp": datetime.fromtimestamp,
+        "utc": _UTC,
+        "wrong_type": _wrong_type,
+        "missing": _missing,
+    }
+    required = _get_required_fields(cls)
+    nested = {}
+    lines = ["def build(source):", "    kwargs = {}"]
+    for name, type_ in _get_fields(cls):
+        expression = _get_expression(type_, "value", name, namespace, nested)
+        if type_ is str and name in _INTERNED_FIELDS:
+            expression = f"intern({expression})"
+        for i, key in enumerate(_SOURCE_KEYS.get(name, (name,))):
+            lines.append(f"    {'elif' if i else 'if'} {key!r} in source:")
+            if expression == "value":
+                lines.append(f"        kwargs[{name!r}] = source[{key!r}]")
+            else:
+                lines.append(f"        value = source[{key!r}]")
+                lines.append(
+                    f"        kwargs[{name!r}] = "
+                    f"None if value is None else {expression}"
+                )
+        if name in required:
+            lines.append("    else:")
+            lines.append(f"        missing(cls, {name!r})")
+    lines.append("    return cls(**kwargs)")
+    exec(compile("\n".join(lines), f"<{cls.__qualname__} builder>", "exec"), namespace)
+    build = namespace["build"]
+
+    # Registered before binding the nested builders, so recursive types
+    # (e.g. ``Message.reply_to_message``) are bound to this builder.
+    pending[cls] = build
+    for nested_type, builder_name in nested.items():
+        namespace[builder_name] = _generate_builder(nested_type, pending)
+    return build
+
+
+def _get_expression(
+    type_: Any, value: str, name: str, namespace: dict, nested: dict, depth: int = 0
+) -> str:
+    """Return the source code converting the value to the given type.
+
+    Args:
+        type_: The type of the field.
+        value: The name of the variable holding the source value.
+        name: The field name.
+        namespace: Globals of the generated function.
+        nested: Builder names of the nested types: {type: builder name}.
+        depth: List nesting level.
+    """
+    origin = get_origin(type_)
+    if origin is list:
+        (item_type,) = get_args(type_)
+        item = f"item{depth}"
+        item_expression = _get_expression(
+            item_type, item, name, namespace, nested, depth + 1
+        )
+        return f"[{item_expression} for {item} in {value}]"
+    elif origin is Union:
+        converter_name = f"convert_{len(namespace)}"
+        namespace[converter_name] = _get_union_converter(type_)
+        return f"{converter_name}({value})"
+    elif type_ is datetime:
+        return f"fromtimestamp({value}, utc)"
+    elif isinstance(type_, type) and issubclass(type_, TelegramType):
+        builder_name = nested.setdefault(type_, f"build_{len(nested)}")
+        return f"{builder_name}({value})"
+    elif type_ in _SCALAR_TYPES:
+        types_name = f"{type_.__name__}_types"
+        namespace[types_name] = _SCALAR_TYPES[type_]
+        return (
+            f"({value} if isinstance({value}, {types_name}) "
+            f"else wrong_type(cls, {name!r}, {value}))"
+        )
+    else:
+        return value
+
+
+def _missing(cls: type, name: str):
+    raise TelegramTypeError(f'missing value for field "{cls.__name__}.{name}"')
+
+
+def _wrong_type(cls: type, name: str, value: Any):
+    raise TelegramTypeError(
+        f'wrong value type for field "{cls.__name__}.{name}": {value!r}'
+    )
+
+
+def _build(cls: type, source: dict):
+    """Create the dataclass instance from the source dictionary."""
+    return _get_builder(cls)(source)
+
+
+@lru_cache(maxsize=None)
+def _get_union_converter(type_: Any) -> Callable[[Any], Any]:
+    """Return the function converting source value to the given union type."""
+    telegram_types = []
+    other_types = []
+    for member in get_args(type_):
+        if isinstance(member, type) and issubclass(member, TelegramType):
+            telegram_types.append(member)
+        else:
+            other_types.append(get_origin(member) or member)
+    other_types = tuple(other_types)
+
+    def convert(value):
+        if isinstance(value, dict):
+            # The first type that has all its required fields in the dictionary
+            for telegram_type in telegram_types:
+                if _has_required_fields(telegram_type, value):
+                    return _build(telegram_type, value)
+        elif isinstance(value, other_types):
+            return value
+        raise TelegramTypeError(f"value doesn't match any type of {type_}: {value!r}")
+
+    return convert
+
+
+def _has_required_fields(cls: type, source: dict) -> bool:
+    """Check whether the source dictionary has all the required fields."""
+    return all(
+        any(key in source for key in _SOURCE_KEYS.get(name, (name,)))
+        for name in _get_required_fields(cls)
+    )
 
 
+@_slotted
 @dataclass(eq=True)
 class Update(TelegramType):
     """
@@ -197,6 +449,7 @@ class WebhookInfo(TelegramType):
     allowed_updates: List[str] = None
 
 
+@_slotted
 @dataclass(eq=True)
 class User(TelegramType):
     """
@@ -235,6 +488,7 @@ class User(TelegramType):
     supports_inline_queries: bool = None
 
 
+@_slotted
 @dataclass(eq=True)
 class Chat(TelegramType):
     """
@@ -310,6 +564,7 @@ class Chat(TelegramType):
     location: ChatLocation = None
 
 
+@_slotted
 @dataclass(eq=True)
 class Message(TelegramType):
     """
@@ -1318,6 +1573,7 @@ class LoginUrl(TelegramType):
     request_write_access: bool = None
 
 
+@_slotted
 @dataclass(eq=True)
 class CallbackQuery(TelegramType):
     """
@@ -29,7 +29,6 @@ from functools import cached_property
 from typing import Optional
 
 from django.db.models import QuerySet
-from django.db.models.signals import post_save
 from django.forms import Form
 from django.test import TransactionTestCase
 from django.utils import timezone
@@ -41,6 +40,7 @@ from django_chatbot.models import Bot, CallbackQuery, Chat, Message, Update, Use
 from django_chatbot.telegram import types
 
 START_USER_ID = 1000
+COMMAND_PATTERN = re.compile(r"/\w+")
 
 logger = logging.getLogger(__name__)
 
@@ -74,10 +74,10 @@ class ClientUser:
         self.dispatcher = Dispatcher(bot.token_slug)
 
     def _next_user_id(self) -> int:
-        users = User.objects.all().order_by("user_id")
-        last = users.last()
-        if last:
-            return last.user_id + 1
+        user_ids = User.objects.order_by("user_id").values_list("user_id", flat=True)
+        last = user_ids.last()
+        if last is not None:
+            return last + 1
         else:
             return START_USER_ID
 
@@ -104,27 +104,34 @@ class ClientUser:
                 return form_model.form
 
     def _next_message_id(self) -> int:
-        messages = Message.objects.filter(chat__chat_id=self.user_id).order_by(
-            "message_id"
+        message_ids = (
+            Message.objects.filter(chat__chat_id=self.user_id)
+            .order_by("message_id")
+            .values_list("message_id", flat=True)
         )
-        last = messages.last()
-        if last:
-            return last.message_id + 1
+        last = message_ids.last()
+        if last is not None:
+            return last + 1
         else:
             return 1
 
     def _next_callback_query_id(self) -> str:
-        callbacks = CallbackQuery.objects.all()
-        last = callbacks.last()
-        if last:
-            return str(int(last.callback_query_id) + 1)
+        callback_query_ids = CallbackQuery.objects.order_by("pk").values_list(
+            "callback_query_id", flat=True
+        )
+        last = callback_query_ids.last()
+        if last is not None:
+            return str(int(last) + 1)
         else:
             return "1"
 
     def _next_update_id(self) -> int:
-        last = Update.objects.all().order_by("update_id").last()
-        if last:
-            return last.update_id + 1
+        update_ids = Update.objects.order_by("update_id").values_list(
+            "update_id", flat=True
+        )
+        last = update_ids.last()
+        if last is not None:
+            return last + 1
         else:
             return 1
 
@@ -150,9 +157,8 @@ class ClientUser:
 
     @staticmethod
     def _extract_entities(text: str):
-        pattern = re.compile(r"/\w+")
         entities = []
-        for match in re.finditer(pattern, text):
+        for match in COMMAND_PATTERN.finditer(text):
             offset, end = match.span()
             length = end - offset
             entities.append({"offset": offset, "length": length, "type": "bot_command"})
@@ -358,7 +364,9 @@ class TestCase(TransactionTestCase):
     def _pre_setup(self):
         super()._pre_setup()
         self.bot = self.get_bot()
-        self.bot.test_mode_on()
+        # The default get_bot creates the bot in test mode already
+        if not self.bot.test_mode:
+            self.bot.test_mode_on()
         self.user = ClientUser(bot=self.bot)
         self.client = Client(self.user)
 
@@ -371,10 +379,13 @@ class TestCase(TransactionTestCase):
                 }
                 self.client._changed.append(changes)
 
-        telegram_instance.connect(on_changed, weak=False)
+        telegram_instance.connect(
+            on_changed, weak=False, dispatch_uid="django_chatbot_test_case"
+        )
 
     def _post_teardown(self):
-        post_save.disconnect(dispatch_uid="django_chatbot_test_case")
+        # Otherwise the receivers of all previous tests stay connected
+        telegram_instance.disconnect(dispatch_uid="django_chatbot_test_case")
         super()._post_teardown()
 
     def assertContains(self, response, text, msg=""):
@@ -33,6 +33,11 @@ from django.views.decorators.csrf import csrf_exempt
 
 from django_chatbot.tasks import dispatch
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 log = logging.getLogger(__name__)
 
 
@@ -52,7 +57,10 @@ def webhook(request: HttpRequest, token_slug) -> JsonResponse:
         JsonResponse to Telegram.
 
     """
-    update_data = json.loads(request.body)
+    if orjson is not None:
+        update_data = orjson.loads(request.body)
+    else:
+        update_data = json.loads(request.body)
     dispatch.delay(update_data=update_data, token_slug=token_slug)
     log.debug(
         "Webhook request",
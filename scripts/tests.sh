@@ -2,4 +2,6 @@
 
 ./scripts/wait-for-it.sh app:8000
 cd ./tests
-python manage.py test
\ No newline at end of file
+# Keep the test database between runs, only new migrations are applied.
+# Test classes share no mutable state, so they run in one process per core.
+python manage.py test --keepdb --parallel "$@"
\ No newline at end of file
@@ -57,8 +57,10 @@ setup(
     include_package_data=True,
     install_requires=[
         "celery >= 5.2",
-        "dacite >= 1.6",
         "Django >= 3.2",
         "requests >= 2.27",
     ],
+    extras_require={
+        "orjson": ["orjson >= 3.6"],
+    },
 )
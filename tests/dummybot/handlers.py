@@ -26,11 +26,11 @@ from dummybot import callbacks
 
 from django_chatbot.handlers import CommandHandler, DefaultHandler
 
-handlers = [
+handlers = (
     CommandHandler(
         name="help",
         command="/help",
         callback=callbacks.help,
     ),
     DefaultHandler(name="default", callback=callbacks.default),
-]
+)
@@ -25,7 +25,7 @@ from dummyfatherbot import callbacks, forms
 
 from django_chatbot.handlers import CommandHandler, DefaultHandler
 
-handlers = [
+handlers = (
     CommandHandler(
         name="start",
         command="/start",
@@ -51,4 +51,4 @@ handlers = [
         suppress_form=True,
     ),
     DefaultHandler(name="default", callback=callbacks.default),
-]
+)
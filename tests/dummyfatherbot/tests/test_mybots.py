@@ -32,9 +32,13 @@ class TestMyBots(TestCase):
     reset_sequences = True
 
     def setUp(self) -> None:
-        self.bot_1 = FakeBot.objects.create(name="bot_1", username="username_1_bot")
-        self.bot_2 = FakeBot.objects.create(name="bot_2", username="username_2_bot")
-        self.bot_3 = FakeBot.objects.create(name="bot_3", username="username_3_bot")
+        FakeBot.objects.bulk_create(
+            [
+                FakeBot(name="bot_1", username="username_1_bot"),
+                FakeBot(name="bot_2", username="username_2_bot"),
+                FakeBot(name="bot_3", username="username_3_bot"),
+            ]
+        )
 
     def test_my_bots(self):
         response = self.client.send_message("/mybots")
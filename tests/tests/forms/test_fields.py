@@ -22,15 +22,19 @@
 #  THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 # *****************************************************************************
 from unittest import TestCase
-from unittest.mock import Mock
+from unittest.mock import sentinel
 
 from django_chatbot.forms.fields import Field
 
 
+def false_condition(*args, **kwargs):
+    return False
+
+
 class FieldTest(TestCase):
     def test_assign_value(self):
         field = Field("Input value")
-        field.input("value", Mock())
+        field.input("value", sentinel.form)
         self.assertEqual(field.value, "value")
 
     def test_add_next_field_without_condition(self):
@@ -50,10 +54,9 @@ class FieldTest(TestCase):
     def test_add_next_fields_without_condition(self):
         "Field can be added with and without condition"
         field = Field("Field 1")
-        condition_2a = lambda *args, **kwargs: False
         next_field_2a = Field("Field 2a")
         next_field_2b = Field("Field 2b")
-        field.add_next_fields((next_field_2a, condition_2a), next_field_2b)
+        field.add_next_fields((next_field_2a, false_condition), next_field_2b)
         self.assertEqual(field._next_fields[0][0], next_field_2a)
         self.assertEqual(field._next_fields[1][0], next_field_2b)
 
@@ -61,22 +64,21 @@ class FieldTest(TestCase):
         self.assertFalse(field._next_fields[0][1]())
         self.assertTrue(field._next_fields[1][1]())
 
-    def test_get_next_field_returns_first_next_field_if_no_condition(self):
+    def test_get_next_field_returns_first_next_field_with_true_condition(self):
         value = "value"
-        form = Mock()
-
-        field = Field("Field 1")
-        next_field_2a = Field("Field 2a")
-        next_field_2b = Field("Field 2b")
-        field.add_next_fields(next_field_2a, next_field_2b)
-        self.assertEqual(field.get_next_field(value, form), next_field_2a)
+        form = sentinel.form
 
-    def test_get_next_field_returns_first_next_field_with_condition(self):
-        value = "value"
-        form = Mock()
-
-        field = Field("Field 1")
-        next_field_2a = Field("Field 2a")
-        next_field_2b = Field("Field 2b")
-        field.add_next_fields(next_field_2a, next_field_2b)
-        self.assertEqual(field.get_next_field(value, form), next_field_2a)
+        for condition, expected_name in [
+            (None, "Field 2a"),
+            (false_condition, "Field 2b"),
+        ]:
+            with self.subTest(condition=condition):
+                field = Field("Field 1")
+                next_field_2a = Field("Field 2a")
+                next_field_2b = Field("Field 2b")
+                if condition is None:
+                    field.add_next_fields(next_field_2a, next_field_2b)
+                else:
+                    field.add_next_fields((next_field_2a, condition), next_field_2b)
+                next_field = field.get_next_field(value, form)
+                self.assertEqual(next_field.prompt_message, expected_name)
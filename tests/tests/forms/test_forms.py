@@ -89,6 +89,37 @@ class FormTest(TestCase):
         self.assertEqual(form.second.get_next_field(None, None), form.third)
         self.assertEqual(form.third.get_next_field(None, None), None)
 
+    def test_declared_fields_are_cached_per_class(self):
+        class Form(forms.Form):
+            first = forms.Field("first prompt")
+
+        class ChildForm(Form):
+            second = forms.Field("second prompt")
+
+        Form(repository=FakeRepository())
+        form = ChildForm(repository=FakeRepository())
+
+        self.assertEqual(list(Form._declared_fields), ["first"])
+        self.assertEqual(list(ChildForm._declared_fields), ["first", "second"])
+        self.assertIsNot(form.first, Form.first)
+
+    def test_forms_do_not_share_field_state(self):
+        keyboard = [["button"]]
+
+        class Form(forms.Form):
+            first = forms.Field("first prompt", inline_keyboard=keyboard)
+            second = forms.Field("second prompt")
+
+        form_1 = Form(repository=FakeRepository())
+        form_2 = Form(repository=FakeRepository())
+        form_1.first.input("value", form_1)
+
+        self.assertIsNone(form_2.first.value)
+        self.assertIsNone(Form.first.value)
+        self.assertEqual(Form.first._next_fields, [])
+        self.assertEqual(form_2.first.get_next_field(None, form_2), form_2.second)
+        self.assertIs(form_2.first.inline_keyboard, keyboard)
+
 
 class SimpleFormFlowTest(TestCase):
     def setUp(self) -> None:
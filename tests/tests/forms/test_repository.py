@@ -23,7 +23,7 @@
 # *****************************************************************************
 from unittest.mock import Mock, patch
 
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from factories.factories import FieldFactory, FormFactory, MessageFactory, UpdateFactory
 
 from django_chatbot import models
@@ -37,18 +37,17 @@ class FormForTest(Form):
 
 
 class RepositorySaveFormTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # TestCase gives every test its own copy, so tests may modify it
+        cls.update = UpdateFactory()
+
     def setUp(self) -> None:
         self.handler = Mock()
         self.handler.name = "test_handler"
 
-    def test_save_form(self):
-        update = UpdateFactory()
-        prompt_message = MessageFactory()
-        handler = Mock()
-        handler.name = "handler"
-        repository = FormRepository(update, handler=self.handler)
-        repository.prompt_message = prompt_message
-
+    def _make_form(self):
+        """Return a form with the first field valid and the second invalid."""
         form = FormForTest(repository=self)
 
         form.field1.value = "first_value"
@@ -58,6 +57,17 @@ class RepositorySaveFormTest(TestCase):
 
         form.current_field = form.field2
         form.context = {"context_key": "context_value"}
+        return form
+
+    def test_save_form(self):
+        update = self.update
+        prompt_message = MessageFactory()
+        handler = Mock()
+        handler.name = "handler"
+        repository = FormRepository(update, handler=self.handler)
+        repository.prompt_message = prompt_message
+
+        form = self._make_form()
 
         form_model = repository.save_form(form)
 
@@ -88,20 +98,12 @@ class RepositorySaveFormTest(TestCase):
         """
         If form already exists in database, it should not create new model
         """
-        update = UpdateFactory()
+        update = self.update
         prompt_message = MessageFactory()
         repository = FormRepository(update, handler=self.handler)
         repository.prompt_message = prompt_message
 
-        form = FormForTest(repository=self)
-
-        form.field1.value = "first_value"
-        form.field1.is_valid = True
-        form.field2.value = "second_value"
-        form.field2.is_valid = False
-
-        form.current_field = form.field2
-        form.context = {"context_key": "context_value"}
+        form = self._make_form()
 
         form_model = repository.save_form(form)
 
@@ -119,7 +121,9 @@ class RepositorySaveFormTest(TestCase):
 
         repository.form_model = form_model
         form.field1.value = "new_first_value"
-        form_model = repository.save_form(form)
+        # Only the changed field is written
+        with self.assertNumQueries(1):
+            form_model = repository.save_form(form)
 
         self.assertEqual(models.Form.objects.count(), 1)
         self.assertEqual(form_model, models.Form.objects.first())
@@ -130,6 +134,49 @@ class RepositorySaveFormTest(TestCase):
         self.assertEqual(field1_model.form, form_model)
         self.assertEqual(field1_model.value, "new_first_value")
 
+    def test_save_form_saves_only_changed_fields(self):
+        update = self.update
+        repository = FormRepository(update, handler=self.handler)
+        form = FormForTest(repository=self)
+        form.current_field = form.field1
+        repository.form_model = repository.save_form(form)
+
+        form.field2.value = "second_value"
+        form.field2.is_valid = True
+        with patch.object(FormRepository, "_save_field") as mocked_save_field:
+            repository.save_form(form)
+
+        mocked_save_field.assert_called_once_with(form.field2, repository.form_model)
+
+    def test_save_form__unchanged_form__form_model_not_saved(self):
+        update = self.update
+        repository = FormRepository(update, handler=self.handler)
+        form = FormForTest(repository=self)
+        form.current_field = form.field1
+        form.context = {"context_key": "context_value"}
+        repository.save_form(form)
+
+        with patch.object(models.Form, "save") as mocked_save:
+            repository.save_form(form)
+            mocked_save.assert_not_called()
+
+            form.context["context_key"] = "new_context_value"
+            repository.save_form(form)
+            mocked_save.assert_called_once_with(update_fields=["context", "updated_at"])
+
+    def test_save_form__new_form__fields_inserted_at_once(self):
+        update = self.update
+        repository = FormRepository(update, handler=self.handler)
+        form = FormForTest(repository=self)
+        form.current_field = form.field1
+
+        with patch.object(FormRepository, "_save_field") as mocked_save_field:
+            form_model = repository.save_form(form)
+
+        mocked_save_field.assert_not_called()
+        self.assertEqual(repository.form_model, form_model)
+        self.assertEqual(models.Field.objects.filter(form=form_model).count(), 3)
+
 
 class RepositoryLoadFormTest(TestCase):
     def test_load_form(self):
@@ -155,7 +202,8 @@ class RepositoryLoadFormTest(TestCase):
 
         repository = FormRepository(update=Mock())
 
-        form = repository._load_form(form_model)
+        with self.assertNumQueries(1):
+            form = repository._load_form(form_model)
 
         self.assertEqual(isinstance(form, FormForTest), True)
         self.assertEqual(form.context, {"context_key": "context_value"})
@@ -164,9 +212,13 @@ class RepositoryLoadFormTest(TestCase):
         self.assertEqual(form.field1.is_valid, True)
         self.assertEqual(form.field2.value, "second_value")
         self.assertEqual(form.field2.is_valid, False)
+        self.assertEqual(
+            repository._stored_fields,
+            {"field1": ("first_value", True), "field2": ("second_value", False)},
+        )
 
 
-class RepositoryInitTest(TestCase):
+class RepositoryInitTest(SimpleTestCase):
     @patch("django_chatbot.forms.forms.Form.start")
     def test_form_created_from_form_class(self, mocked_form_start):
         form_class = FormForTest
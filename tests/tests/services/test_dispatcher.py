@@ -1,8 +1,9 @@
-from unittest.mock import Mock, call, patch
+from unittest.mock import Mock, patch
 
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 
-from django_chatbot.dispatcher import Dispatcher, _load_bot_handlers, load_handlers
+from django_chatbot.dispatcher import Dispatcher, _load_bot_handlers
+from django_chatbot.handlers import CommandHandler
 from django_chatbot.models import Bot
 
 handlers = [
@@ -11,58 +12,25 @@ handlers = [
 ]
 
 
-class LoadBotHandlersTestCase(TestCase):
-    def setUp(self) -> None:
-        handler1 = Mock()
-        handler2 = Mock()
-        self.handlers = [
-            handler1,
-            handler2,
-        ]
-
+class LoadBotHandlersTestCase(SimpleTestCase):
     def test_load_bot_handlers(self):
         bot_handlers = _load_bot_handlers("tests.services.test_dispatcher")
 
         self.assertEqual(bot_handlers, handlers)
 
 
-class LoadHandlersTestCase(TestCase):
-    @patch("django_chatbot.dispatcher._load_bot_handlers")
-    def test_load_handlers(self, mocked_load_bot_handlers: Mock):
+@patch("django_chatbot.dispatcher._load_bot_handlers")
+class DispatcherTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
         Bot.objects.create(name="bot1", token="token1", root_handlerconf="module1")
-        Bot.objects.create(name="bot2", token="token2", root_handlerconf="module2")
-        mocked_load_bot_handlers.side_effect = [
-            ["handler1_1", "handler1_2"],
-            ["handler2_1", "handler2_2"],
-        ]
-
-        handlers = load_handlers()
-
-        self.assertEqual(
-            handlers,
-            {
-                "token1": ["handler1_1", "handler1_2"],
-                "token2": ["handler2_1", "handler2_2"],
-            },
-        )
-        self.assertEqual(
-            mocked_load_bot_handlers.mock_calls,
-            [
-                call("module1"),
-                call("module2"),
-            ],
+        cls.bot = Bot.objects.create(
+            name="bot2", token="token2", root_handlerconf="module2"
         )
+        Bot.objects.create(name="bot3", token="token3", root_handlerconf="module3")
+        cls.update_data = {"key": "value"}
 
-
-@patch("django_chatbot.dispatcher.load_handlers")
-class DispatcherTestCase(TestCase):
-    def setUp(self) -> None:
-        Bot.objects.create(name="bot1", token="token1")
-        self.bot = Bot.objects.create(name="bot2", token="token2")
-        Bot.objects.create(name="bot3", token="token3")
-        self.update_data = {"key": "value"}
-
-        self.token_slug = "token2"
+        cls.token_slug = "token2"
 
     @patch("django_chatbot.dispatcher.Update.objects.from_telegram")
     @patch("django_chatbot.dispatcher.TelegramUpdate.from_dict")
@@ -70,7 +38,7 @@ class DispatcherTestCase(TestCase):
         self,
         mocked_from_dict: Mock,
         mocked_from_telegram: Mock,
-        mocked_load_handlers: Mock,
+        mocked_load_bot_handlers: Mock,
     ):
         update = Mock()
         telegram_update = Mock()
@@ -81,13 +49,44 @@ class DispatcherTestCase(TestCase):
 
         self.assertEqual(dispatcher.bot, self.bot)
 
+    def test_init__handler_index_reused(self, mocked_load_bot_handlers: Mock):
+        handlers = [CommandHandler("start", command="/start")]
+        mocked_load_bot_handlers.side_effect = {"module2": handlers}.get
+
+        dispatcher_1 = Dispatcher(self.token_slug)
+        dispatcher_2 = Dispatcher(self.token_slug)
+        mocked_load_bot_handlers.side_effect = {"module2": list(handlers)}.get
+        dispatcher_3 = Dispatcher(self.token_slug)
+
+        self.assertIs(dispatcher_1._handler_index, dispatcher_2._handler_index)
+        self.assertIsNot(dispatcher_1._handler_index, dispatcher_3._handler_index)
+
+    def test_init__handlerconf_changed__handlers_reloaded(
+        self, mocked_load_bot_handlers: Mock
+    ):
+        handlers_2 = [CommandHandler("start", command="/start")]
+        handlers_4 = [CommandHandler("help", command="/help")]
+        mocked_load_bot_handlers.side_effect = {
+            "module2": handlers_2,
+            "module4": handlers_4,
+        }.get
+        Dispatcher(self.token_slug)
+        # Changed by another process, no signals are sent
+        Bot.objects.filter(pk=self.bot.pk).update(root_handlerconf="module4")
+
+        dispatcher = Dispatcher(self.token_slug)
+
+        self.assertIs(dispatcher.handlers, handlers_4)
+
+    @patch("django_chatbot.dispatcher.Form.objects.get_form", return_value=None)
     @patch("django_chatbot.dispatcher.Update.objects.from_telegram")
     @patch("django_chatbot.dispatcher.TelegramUpdate.from_dict")
     def test_dispatch(
         self,
         mocked_from_dict: Mock,
         mocked_from_telegram: Mock,
-        mocked_load_handlers: Mock,
+        mocked_get_form: Mock,
+        mocked_load_bot_handlers: Mock,
     ):
         update = Mock()
         telegram_update = Mock()
@@ -96,10 +95,10 @@ class DispatcherTestCase(TestCase):
         handler_1 = Mock(**{"match.return_value": False})
         handler_2 = Mock(**{"match.return_value": True})
         handler_3 = Mock(**{"match.return_value": True})
-        mocked_load_handlers.return_value = {
-            "token1": [handler_3],
-            "token2": [handler_1, handler_2, handler_3],
-        }
+        mocked_load_bot_handlers.side_effect = {
+            "module1": [handler_3],
+            "module2": [handler_1, handler_2, handler_3],
+        }.get
         dispatcher = Dispatcher(token_slug="token2")
 
         dispatcher.dispatch(update_data={})
@@ -111,6 +110,96 @@ class DispatcherTestCase(TestCase):
         handler_2.handle_update.assert_called_with(update=update)
         handler_3.handle_update.assert_not_called()
 
+    @patch("django_chatbot.dispatcher.Form.objects.get_form", return_value=None)
+    @patch("django_chatbot.dispatcher.Update.objects.from_telegram")
+    @patch("django_chatbot.dispatcher.TelegramUpdate.from_dict")
+    def test_dispatch__command_handler(
+        self,
+        mocked_from_dict: Mock,
+        mocked_from_telegram: Mock,
+        mocked_get_form: Mock,
+        mocked_load_bot_handlers: Mock,
+    ):
+        update = Mock()
+        update.message.entities = [Mock(type="bot_command", text="/help")]
+        mocked_from_telegram.return_value = update
+        start_callback = Mock()
+        help_callback = Mock()
+        default_handler = Mock(**{"match.return_value": True})
+        mocked_load_bot_handlers.side_effect = {
+            "module2": [
+                CommandHandler("start", command="/start", callback=start_callback),
+                CommandHandler("help", command="/help", callback=help_callback),
+                default_handler,
+            ],
+        }.get
+        dispatcher = Dispatcher(token_slug="token2")
+
+        dispatcher.dispatch(update_data={})
+
+        start_callback.assert_not_called()
+        help_callback.assert_called_with(update)
+        default_handler.match.assert_not_called()
+
+    @patch("django_chatbot.dispatcher.Form.objects.get_form", return_value=None)
+    @patch("django_chatbot.dispatcher.Update.objects.from_telegram")
+    @patch("django_chatbot.dispatcher.TelegramUpdate.from_dict")
+    def test_dispatch__command_handler__previous_handler_takes_precedence(
+        self,
+        mocked_from_dict: Mock,
+        mocked_from_telegram: Mock,
+        mocked_get_form: Mock,
+        mocked_load_bot_handlers: Mock,
+    ):
+        update = Mock()
+        update.message.entities = [Mock(type="bot_command", text="/help")]
+        mocked_from_telegram.return_value = update
+        help_callback = Mock()
+        handler_1 = Mock(**{"match.return_value": False})
+        handler_2 = Mock(**{"match.return_value": True})
+        mocked_load_bot_handlers.side_effect = {
+            "module2": [
+                handler_1,
+                handler_2,
+                CommandHandler("help", command="/help", callback=help_callback),
+            ],
+        }.get
+        dispatcher = Dispatcher(token_slug="token2")
+
+        dispatcher.dispatch(update_data={})
+
+        handler_1.match.assert_called_with(update=update)
+        handler_2.handle_update.assert_called_with(update=update)
+        help_callback.assert_not_called()
+
+    @patch("django_chatbot.dispatcher.Form.objects.get_form", return_value=None)
+    @patch("django_chatbot.dispatcher.Update.objects.from_telegram")
+    @patch("django_chatbot.dispatcher.TelegramUpdate.from_dict")
+    def test_dispatch__no_command__falls_through_to_other_handlers(
+        self,
+        mocked_from_dict: Mock,
+        mocked_from_telegram: Mock,
+        mocked_get_form: Mock,
+        mocked_load_bot_handlers: Mock,
+    ):
+        update = Mock()
+        update.message.entities = []
+        mocked_from_telegram.return_value = update
+        help_callback = Mock()
+        default_handler = Mock(**{"match.return_value": True})
+        mocked_load_bot_handlers.side_effect = {
+            "module2": [
+                CommandHandler("help", command="/help", callback=help_callback),
+                default_handler,
+            ],
+        }.get
+        dispatcher = Dispatcher(token_slug="token2")
+
+        dispatcher.dispatch(update_data={})
+
+        help_callback.assert_not_called()
+        default_handler.handle_update.assert_called_with(update=update)
+
     @patch("django_chatbot.dispatcher.FormRepository")
     @patch("django_chatbot.dispatcher.Form.objects.get_form")
     @patch("django_chatbot.dispatcher.Update.objects.from_telegram")
@@ -121,7 +210,7 @@ class DispatcherTestCase(TestCase):
         mocked_from_telegram: Mock,
         mocked_get_form: Mock,
         mocked_form_repository: Mock,
-        mocked_load_handlers: Mock,
+        mocked_load_bot_handlers: Mock,
     ):
         update = Mock()
         telegram_update = Mock()
@@ -130,7 +219,7 @@ class DispatcherTestCase(TestCase):
         form_model = Mock()
         mocked_get_form.return_value = form_model
         handler = Mock(**{"match.return_value": True}, suppress_form=False)
-        mocked_load_handlers.return_value = {"token2": [handler]}
+        mocked_load_bot_handlers.side_effect = {"module2": [handler]}.get
 
         dispatcher = Dispatcher(token_slug="token2")
 
@@ -149,7 +238,7 @@ class DispatcherTestCase(TestCase):
         mocked_from_telegram: Mock,
         mocked_get_form: Mock,
         mocked_form_repository: Mock,
-        mocked_load_handlers: Mock,
+        mocked_load_bot_handlers: Mock,
     ):
         update = Mock()
         telegram_update = Mock()
@@ -158,7 +247,7 @@ class DispatcherTestCase(TestCase):
         form_model = Mock()
         mocked_get_form.return_value = form_model
         handler = Mock(**{"match.return_value": True}, suppress_form=True)
-        mocked_load_handlers.return_value = {"token2": [handler]}
+        mocked_load_bot_handlers.side_effect = {"module2": [handler]}.get
 
         dispatcher = Dispatcher(token_slug="token2")
 
@@ -1,17 +1,30 @@
+import json
 from dataclasses import dataclass
 from typing import List
 from unittest import TestCase
 from unittest.mock import Mock, patch
 
-from django_chatbot.telegram.api import TelegramError, _Binder
-from django_chatbot.telegram.types import TelegramType
+import requests
+
+from django_chatbot.telegram.api import TelegramError, _Binder, _dumps
+from django_chatbot.telegram.types import (
+    InlineKeyboardButton,
+    InlineKeyboardMarkup,
+    TelegramType,
+)
+
+
+def make_response(status_code: int, data: dict) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(data).encode()
+    return response
 
 
 class BinderTestCase(TestCase):
-    @patch("django_chatbot.telegram.api.requests.get")
+    @patch("django_chatbot.telegram.api._SESSION.get")
     def test_bind__without_params_invokes_get(self, mocked_get: Mock):
-        mocked_get.return_value.status_code = 200
-        mocked_get.return_value.json.return_value = {"ok": True, "result": None}
+        mocked_get.return_value = make_response(200, {"ok": True, "result": None})
         binder = _Binder(token="test_token", method_name="method_name")
 
         binder.bind()
@@ -20,10 +33,9 @@ class BinderTestCase(TestCase):
             url="https://api.telegram.org/bottest_token/method_name"
         )
 
-    @patch("django_chatbot.telegram.api.requests.post")
+    @patch("django_chatbot.telegram.api._SESSION.post")
     def test_bind__with_params_invokes_post(self, mocked_post: Mock):
-        mocked_post.return_value.status_code = 200
-        mocked_post.return_value.json.return_value = {"ok": True, "result": None}
+        mocked_post.return_value = make_response(200, {"ok": True, "result": None})
         params = {"a": 1, "b": 2}
         binder = _Binder(token="test_token", method_name="method_name", params=params)
 
@@ -34,10 +46,9 @@ class BinderTestCase(TestCase):
             data=params,
         )
 
-    @patch("django_chatbot.telegram.api.requests.post")
+    @patch("django_chatbot.telegram.api._SESSION.post")
     def test_bind__with_params_ignores_none_params(self, mocked_post: Mock):
-        mocked_post.return_value.status_code = 200
-        mocked_post.return_value.json.return_value = {"ok": True, "result": None}
+        mocked_post.return_value = make_response(200, {"ok": True, "result": None})
         params = {"a": 1, "b": None, "c": 2}
         binder = _Binder(token="test_token", method_name="method_name", params=params)
 
@@ -48,38 +59,42 @@ class BinderTestCase(TestCase):
             data={"a": 1, "c": 2},
         )
 
-    @patch("django_chatbot.telegram.api.requests.get")
+    @patch("django_chatbot.telegram.api._SESSION.get")
     def test_bind__without_return_type_returns_dict(self, mocked_get: Mock):
-        mocked_get.return_value.status_code = 200
-        mocked_get.return_value.json.return_value = {
-            "ok": True,
-            "result": {"answer": 42},
-        }
+        mocked_get.return_value = make_response(
+            200,
+            {
+                "ok": True,
+                "result": {"answer": 42},
+            },
+        )
         binder = _Binder(token="test_token", method_name="method_name")
 
         result = binder.bind()
 
         self.assertEqual(result, {"answer": 42})
 
-    @patch("django_chatbot.telegram.api.requests.get")
+    @patch("django_chatbot.telegram.api._SESSION.get")
     def test_bind__with_return_type_returns_filled_object_of_type(
         self, mocked_get: Mock
     ):
-        mocked_get.return_value.status_code = 200
-        mocked_get.return_value.json.return_value = {
-            "ok": True,
-            "result": {
-                "parent_p1": 1,
-                "parent_p2": {
-                    "child_p1": [
-                        {"grandchild_p1": 5, "grandchild_p2": ["a", "b"]},
-                        {"grandchild_p1": 6, "grandchild_p2": ["c", "d"]},
-                        {"grandchild_p1": 7, "grandchild_p2": ["e", "f"]},
-                    ],
-                    "child_p2": 2,
+        mocked_get.return_value = make_response(
+            200,
+            {
+                "ok": True,
+                "result": {
+                    "parent_p1": 1,
+                    "parent_p2": {
+                        "child_p1": [
+                            {"grandchild_p1": 5, "grandchild_p2": ["a", "b"]},
+                            {"grandchild_p1": 6, "grandchild_p2": ["c", "d"]},
+                            {"grandchild_p1": 7, "grandchild_p2": ["e", "f"]},
+                        ],
+                        "child_p2": 2,
+                    },
                 },
             },
-        }
+        )
 
         @dataclass(eq=True)
         class GrandChild(TelegramType):
@@ -118,17 +133,34 @@ class BinderTestCase(TestCase):
             ),
         )
 
-    @patch("django_chatbot.telegram.api.requests.get")
+    @patch("django_chatbot.telegram.api._SESSION.get")
     def test_bind__telegram_not_ok(self, mocked_get: Mock):
-        mocked_get.return_value.status_code = 401
-        mocked_get.return_value.json.return_value = {
-            "ok": False,
-            "error_code": 401,
-            "description": "Unauthorized",
-        }
+        mocked_get.return_value = make_response(
+            401,
+            {
+                "ok": False,
+                "error_code": 401,
+                "description": "Unauthorized",
+            },
+        )
         binder = _Binder(token="test_token", method_name="method_name")
 
         with self.assertRaises(TelegramError) as context:
             binder.bind()
 
         self.assertEqual(context.exception.reason, "Unauthorized")
+
+
+class DumpsTestCase(TestCase):
+    def setUp(self):
+        self.reply_markup = InlineKeyboardMarkup(
+            inline_keyboard=[[InlineKeyboardButton(text="Yes", callback_data="yes")]]
+        )
+        self.expected = {"inline_keyboard": [[{"text": "Yes", "callback_data": "yes"}]]}
+
+    def test_dumps__telegram_type(self):
+        self.assertEqual(json.loads(_dumps(self.reply_markup)), self.expected)
+
+    @patch("django_chatbot.telegram.api.orjson", None)
+    def test_dumps__telegram_type_without_orjson(self):
+        self.assertEqual(json.loads(_dumps(self.reply_markup)), self.expected)
@@ -1,27 +1,96 @@
 import copy
+import json
+import os
+import time
 from dataclasses import dataclass
 from typing import List
 from unittest import TestCase
+from unittest.mock import patch
 
 from django.utils import timezone
 
 from django_chatbot.telegram.types import (
     CallbackQuery,
     Chat,
+    InlineQueryResultArticle,
+    InputLocationMessageContent,
     Message,
     TelegramType,
+    TelegramTypeError,
     Update,
     User,
 )
 
+# The datetime of the 1441645532 timestamp used in the sources below
+TIMESTAMP_DATE = timezone.datetime(2015, 9, 7, 17, 5, 32, tzinfo=timezone.utc)
+SOURCE_USER = {
+    "last_name": "Test Lastname",
+    "is_bot": False,
+    "id": 1111111,
+    "first_name": "Test Firstname",
+    "username": "Testusername",
+}
+SOURCE_MESSAGE_WITH_TEXT = {
+    "update_id": 10000,
+    "message": {
+        "date": 1441645532,
+        "chat": {
+            "last_name": "Test Lastname",
+            "id": 1111111,
+            "type": "private",
+            "first_name": "Test Firstname",
+            "username": "Testusername",
+        },
+        "message_id": 1365,
+        "from": SOURCE_USER,
+        "text": "/start",
+    },
+}
+SOURCE_CALLBACK_QUERY = {
+    "update_id": 10000,
+    "callback_query": {
+        "id": "4382bfdwdsb323b2d9",
+        "chat_instance": "42a",
+        "from": SOURCE_USER,
+        "data": "Data from button callback",
+        "inline_message_id": "1234csdbsk4839",
+    },
+}
+SOURCE_EDITED_CHANNEL_POST = {
+    "update_id": 10000,
+    "edited_channel_post": {
+        "message_id": 16,
+        "sender_chat": {
+            "id": -1001,
+            "title": "test_channel",
+            "type": "channel",
+        },
+        "chat": {"id": -1001, "title": "test_channel", "type": "channel"},
+        "date": 1615492954,
+        "edit_date": 1615493064,
+        "text": "post3",
+    },
+}
+
+
+def make_source(template: dict) -> dict:
+    """Return a copy of the payload template that a test can own."""
+    return copy.deepcopy(template)
+
 
 class TelegramTypeTestCase(TestCase):
     def test_timestamp_to_datetime(self):
         timestamp = 1441645532
         dt = TelegramType.timestamp_to_datetime(timestamp)
-        self.assertEqual(
-            dt, timezone.datetime(2015, 9, 7, 17, 5, 32, tzinfo=timezone.utc)
-        )
+        self.assertEqual(dt, TIMESTAMP_DATE)
+
+    def test_timestamp_to_datetime__local_timezone_is_ignored(self):
+        self.addCleanup(time.tzset)
+        with patch.dict(os.environ, {"TZ": "America/New_York"}):
+            time.tzset()
+            dt = TelegramType.timestamp_to_datetime(1441645532)
+
+        self.assertEqual(dt, TIMESTAMP_DATE)
 
     def test_convert_to_date(self):
         source = {
@@ -38,12 +107,10 @@ class TelegramTypeTestCase(TestCase):
         self.assertEqual(
             converted,
             {
-                "date": timezone.datetime(2015, 9, 7, 17, 5, 32, tzinfo=timezone.utc),
+                "date": TIMESTAMP_DATE,
                 "num": 1,
                 "child": {
-                    "edit_date": timezone.datetime(
-                        2015, 9, 7, 17, 5, 32, tzinfo=timezone.utc
-                    ),
+                    "edit_date": TIMESTAMP_DATE,
                     "num": 1,
                 },
             },
@@ -51,10 +118,10 @@ class TelegramTypeTestCase(TestCase):
 
     def test_convert_to_timestamps(self):
         source = {
-            "date": timezone.datetime(2015, 9, 7, 17, 5, 32, tzinfo=timezone.utc),
+            "date": TIMESTAMP_DATE,
             "num": 1,
             "child": {
-                "date": timezone.datetime(2015, 9, 7, 17, 5, 32, tzinfo=timezone.utc),
+                "date": TIMESTAMP_DATE,
                 "num": 1,
             },
         }
@@ -114,7 +181,7 @@ class TelegramTypeTestCase(TestCase):
                 ],
             },
         }
-        source = copy.deepcopy(source_data)
+        snapshot = json.dumps(source_data)
 
         @dataclass(frozen=True)
         class GrandChild(TelegramType):
@@ -132,7 +199,7 @@ class TelegramTypeTestCase(TestCase):
             parent_p1: int
             parent_p2: Child
 
-        parent = Parent.from_dict(source=source)
+        parent = Parent.from_dict(source=source_data)
 
         self.assertEqual(
             parent,
@@ -155,7 +222,64 @@ class TelegramTypeTestCase(TestCase):
                 ),
             ),
         )
-        self.assertEqual(source, source_data)
+        self.assertEqual(json.dumps(source_data), snapshot)
+
+    def test_from_dict__converts_dates_by_field_type(self):
+        @dataclass(frozen=True)
+        class Child(TelegramType):
+            date: timezone.datetime
+
+        @dataclass(frozen=True)
+        class Parent(TelegramType):
+            children: List[Child]
+            edit_date: timezone.datetime = None
+
+        parent = Parent.from_dict(source={"children": [{"date": 1441645532}]})
+
+        self.assertEqual(
+            parent,
+            Parent(children=[Child(date=TIMESTAMP_DATE)]),
+        )
+
+    def test_from_dict__interns_enum_like_strings(self):
+        first = Chat.from_dict({"id": 1, "type": "".join(["pri", "vate"])})
+        second = Chat.from_dict({"id": 2, "type": "".join(["priv", "ate"])})
+
+        self.assertIs(first.type, second.type)
+
+    def test_from_dict__wrong_value_type__raises(self):
+        with self.assertRaisesRegex(TelegramTypeError, '"User.id"'):
+            User.from_dict({"id": "abc", "is_bot": False, "first_name": "Name"})
+
+    def test_from_dict__missing_required_field__raises(self):
+        with self.assertRaisesRegex(TelegramTypeError, '"User.is_bot"'):
+            User.from_dict({"id": 1, "first_name": "Name"})
+
+    def test_from_dict__union__first_matching_type(self):
+        result = InlineQueryResultArticle.from_dict(
+            {
+                "type": "article",
+                "id": "1",
+                "title": "Title",
+                "input_message_content": {"latitude": 1.5, "longitude": 2.5},
+            }
+        )
+
+        self.assertEqual(
+            result.input_message_content,
+            InputLocationMessageContent(latitude=1.5, longitude=2.5),
+        )
+
+    def test_from_dict__union__no_matching_type__raises(self):
+        with self.assertRaises(TelegramTypeError):
+            InlineQueryResultArticle.from_dict(
+                {
+                    "type": "article",
+                    "id": "1",
+                    "title": "Title",
+                    "input_message_content": {"bogus": 1},
+                }
+            )
 
     def test_to_dict(self):
         @dataclass(frozen=True)
@@ -202,64 +326,71 @@ class TelegramTypeTestCase(TestCase):
             },
         )
 
+    def test_to_dict__date_as_timestamp(self):
+        update = Update.from_dict(source=make_source(SOURCE_EDITED_CHANNEL_POST))
 
-class UpdateTestCase(TestCase):
-    def test_init(self):
-        source = {
-            "update_id": 10000,
-            "message": {
-                "date": 1,
-                "chat": {
-                    "last_name": "Test Lastname",
-                    "id": 1111111,
-                    "type": "private",
-                    "first_name": "Test Firstname",
-                    "username": "Testusername",
-                },
-                "message_id": 1365,
-                "from": {
-                    "last_name": "Test Lastname",
-                    "id": 1111111,
-                    "is_bot": False,
-                    "first_name": "Test Firstname",
-                    "username": "Testusername",
+        as_dict = update.to_dict(date_as_timestamp=True)
+
+        self.assertEqual(
+            as_dict,
+            {
+                "update_id": 10000,
+                "edited_channel_post": {
+                    "message_id": 16,
+                    "sender_chat": {
+                        "id": -1001,
+                        "title": "test_channel",
+                        "type": "channel",
+                    },
+                    "chat": {"id": -1001, "title": "test_channel", "type": "channel"},
+                    "date": 1615492954,
+                    "edit_date": 1615493064,
+                    "text": "post3",
+                    "delete_chat_photo": True,
+                    "group_chat_created": True,
+                    "supergroup_chat_created": True,
+                    "channel_chat_created": True,
                 },
-                "text": "/start",
             },
-        }
+        )
 
-        update = Update.from_dict(source)
+
+class UpdateTestCase(TestCase):
+    def test_init(self):
+        update = Update.from_dict(source=make_source(SOURCE_MESSAGE_WITH_TEXT))
         self.assertEqual(update.update_id, 10000)
 
 
+class SlotsTestCase(TestCase):
+    def test_update_types_have_no_instance_dict(self):
+        update = Update.from_dict(
+            {
+                "update_id": 1,
+                "message": {
+                    "message_id": 1,
+                    "date": 1,
+                    "chat": {"id": 1, "type": "private"},
+                    "from": {"id": 1, "is_bot": False, "first_name": "Test"},
+                },
+            }
+        )
+
+        for obj in [
+            update,
+            update.message,
+            update.message.chat,
+            update.message.from_user,
+        ]:
+            with self.subTest(type=type(obj).__name__):
+                self.assertFalse(hasattr(obj, "__dict__"))
+        self.assertEqual(update.message.text, None)
+
+
 class UpdateFromDictTestCase(TestCase):
     """ """
 
     def test_message_with_text(self):
-        source = {
-            "update_id": 10000,
-            "message": {
-                "date": 1441645532,
-                "chat": {
-                    "last_name": "Test Lastname",
-                    "id": 1111111,
-                    "type": "private",
-                    "first_name": "Test Firstname",
-                    "username": "Testusername",
-                },
-                "message_id": 1365,
-                "from": {
-                    "last_name": "Test Lastname",
-                    "is_bot": False,
-                    "id": 1111111,
-                    "first_name": "Test Firstname",
-                    "username": "Testusername",
-                },
-                "text": "/start",
-            },
-        }
-
-        update = Update.from_dict(source=source)
+        update = Update.from_dict(source=make_source(SOURCE_MESSAGE_WITH_TEXT))
 
         self.assertEqual(update.update_id, 10000)
         self.assertEqual(
@@ -269,7 +400,7 @@ class UpdateFromDictTestCase(TestCase):
                 message=Message(
                     message_id=1365,
                     text="/start",
-                    date=timezone.datetime(2015, 9, 7, 17, 5, 32, tzinfo=timezone.utc),
+                    date=TIMESTAMP_DATE,
                     chat=Chat(
                         id=1111111,
                         type="private",
@@ -289,24 +420,7 @@ class UpdateFromDictTestCase(TestCase):
         )
 
     def test_callback_query(self):
-        source = {
-            "update_id": 10000,
-            "callback_query": {
-                "id": "4382bfdwdsb323b2d9",
-                "chat_instance": "42a",
-                "from": {
-                    "last_name": "Test Lastname",
-                    "is_bot": False,
-                    "id": 1111111,
-                    "first_name": "Test Firstname",
-                    "username": "Testusername",
-                },
-                "data": "Data from button callback",
-                "inline_message_id": "1234csdbsk4839",
-            },
-        }
-
-        update = Update.from_dict(source=source)
+        update = Update.from_dict(source=make_source(SOURCE_CALLBACK_QUERY))
 
         self.assertEqual(update.update_id, 10000)
         self.assertEqual(
@@ -330,22 +444,7 @@ class UpdateFromDictTestCase(TestCase):
         )
 
     def test_edited_channel_post(self):
-        source = {
-            "update_id": 10000,
-            "edited_channel_post": {
-                "message_id": 16,
-                "sender_chat": {
-                    "id": -1001,
-                    "title": "test_channel",
-                    "type": "channel",
-                },
-                "chat": {"id": -1001, "title": "test_channel", "type": "channel"},
-                "date": 1615492954,
-                "edit_date": 1615493064,
-                "text": "post3",
-            },
-        }
-        update = Update.from_dict(source=source)
+        update = Update.from_dict(source=make_source(SOURCE_EDITED_CHANNEL_POST))
 
         self.assertEqual(update.update_id, 10000)
         self.assertEqual(
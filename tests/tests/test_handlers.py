@@ -22,11 +22,14 @@
 #  THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 # *****************************************************************************
 
+from unittest.mock import patch
+
 from django.test import TestCase
 from django.utils import timezone
 
 from django_chatbot.handlers import CommandHandler, Handler
 from django_chatbot.models import Bot, Chat, Message, Update
+from django_chatbot.telegram.types import MessageEntity
 
 
 class HandlerTest(TestCase):
@@ -47,7 +50,8 @@ class HandlerTest(TestCase):
 
 
 class CommandHandlerTestCase(TestCase):
-    def setUp(self) -> None:
+    @classmethod
+    def setUpTestData(cls):
         bot = Bot.objects.create(name="bot", token="token")
         chat = Chat.objects.create(bot=bot, chat_id=1, type="private")
         message = Message.objects.create(
@@ -60,7 +64,7 @@ class CommandHandlerTestCase(TestCase):
                 {"offset": 7, "length": 5, "type": "bot_command"},
             ],
         )
-        self.update = Update.objects.create(
+        cls.update = Update.objects.create(
             bot=bot,
             update_id=1,
             message=message,
@@ -75,3 +79,18 @@ class CommandHandlerTestCase(TestCase):
 
         handler = CommandHandler(name="handler", command="/help")
         self.assertEqual(handler.match(self.update), True)
+
+    def test_match__entities_parsed_once(self):
+        handlers = [
+            CommandHandler(name="handler", command=command)
+            for command in ("/end", "/start", "/help")
+        ]
+
+        with patch.object(
+            MessageEntity, "from_dict", wraps=MessageEntity.from_dict
+        ) as mocked_from_dict:
+            for handler in handlers:
+                handler.match(self.update)
+
+        # One call per entity of the message, not per handler
+        self.assertEqual(mocked_from_dict.call_count, 2)
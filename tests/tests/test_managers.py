@@ -1,4 +1,6 @@
-from django.test import TestCase
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from factories.factories import BotFactory, UpdateFactory
 
@@ -27,6 +29,10 @@ from django_chatbot.telegram.types import Message as TelegramMessage
 from django_chatbot.telegram.types import Update as TelegramUpdate
 from django_chatbot.telegram.types import User as TelegramUser
 
+JAN_1_2000 = timezone.datetime(2000, 1, 1, tzinfo=timezone.utc)
+JAN_1_2000_1AM = timezone.datetime(2000, 1, 1, 1, tzinfo=timezone.utc)
+DEC_31_1999 = timezone.datetime(1999, 12, 31, tzinfo=timezone.utc)
+
 
 class BotManagerTestCase(TestCase):
     def test_with_pulling_updates(self):
@@ -101,10 +107,35 @@ class UserManagerTestCase(TestCase):
         self.assertEqual(user.last_name, "last_name")
         self.assertEqual(user.username, "username")
 
+    def test_from_telegram__existing_unchanged__not_saved(self):
+        telegram_user = TelegramUser(
+            id=42,
+            is_bot=False,
+            first_name="first_name",
+            username="username",
+        )
+        User.objects.create(user_id=42, first_name="first_name", username="username")
+
+        with self.assertNumQueries(1):
+            user = User.objects.from_telegram(telegram_user)
+
+        self.assertEqual(user.first_name, "first_name")
+
+    def test_from_telegram__new__selected_once(self):
+        telegram_user = TelegramUser(id=42, is_bot=False, first_name="first_name")
+
+        with CaptureQueriesContext(connection) as context:
+            user = User.objects.from_telegram(telegram_user)
+
+        selects = [q for q in context.captured_queries if q["sql"].startswith("SELECT")]
+        self.assertEqual(len(selects), 1)
+        self.assertEqual(user.user_id, 42)
+
 
 class UpdateManagerTestCase(TestCase):
-    def setUp(self) -> None:
-        self.bot = Bot.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.bot = Bot.objects.create(
             name="bot",
             token="token",
         )
@@ -115,7 +146,7 @@ class UpdateManagerTestCase(TestCase):
             message=TelegramMessage(
                 message_id=41,
                 chat=TelegramChat(id=42, type="private"),
-                date=timezone.datetime(2000, 1, 1, tzinfo=timezone.utc),
+                date=JAN_1_2000,
             ),
         )
 
@@ -137,7 +168,7 @@ class UpdateManagerTestCase(TestCase):
             channel_post=TelegramMessage(
                 message_id=41,
                 chat=TelegramChat(id=-42, type="channel", title="the_channel"),
-                date=timezone.datetime(2000, 1, 1, tzinfo=timezone.utc),
+                date=JAN_1_2000,
                 sender_chat=TelegramChat(id=-42, type="channel", title="the_channel"),
                 text="post",
             ),
@@ -157,7 +188,7 @@ class UpdateManagerTestCase(TestCase):
             edited_channel_post=TelegramMessage(
                 message_id=41,
                 chat=TelegramChat(id=-42, type="channel", title="the_channel"),
-                date=timezone.datetime(2000, 1, 1, tzinfo=timezone.utc),
+                date=JAN_1_2000,
                 sender_chat=TelegramChat(id=-42, type="channel", title="the_channel"),
                 text="post",
             ),
@@ -212,8 +243,9 @@ class UpdateManagerTestCase(TestCase):
 
 
 class ChatManagerTestCase(TestCase):
-    def setUp(self) -> None:
-        self.bot = Bot.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.bot = Bot.objects.create(
             name="bot",
             token="token",
         )
@@ -269,20 +301,30 @@ class ChatManagerTestCase(TestCase):
         self.assertEqual(chat.linked_chat_id, telegram_chat.linked_chat_id)
         self.assertEqual(chat.location, telegram_chat.location)
 
+    def test_from_telegram__existing__bot_is_cached(self):
+        Chat.objects.create(bot=self.bot, chat_id=1, type="private")
+        telegram_chat = TelegramChat(id=1, type="private", title="title")
+
+        chat = Chat.objects.from_telegram(telegram_chat=telegram_chat, bot=self.bot)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(chat.bot, self.bot)
+
 
 class FormManagerTestCase(TestCase):
-    def setUp(self) -> None:
-        self.user = User.objects.create(user_id=1, is_bot=False)
-        self.bot = Bot.objects.create(name="bot", token="token")
-        self.chat = Chat.objects.create(bot=self.bot, chat_id=1, type="private")
-        self.form = Form.objects.create()
-        self.root_message = Message.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(user_id=1, is_bot=False)
+        cls.bot = Bot.objects.create(name="bot", token="token")
+        cls.chat = Chat.objects.create(bot=cls.bot, chat_id=1, type="private")
+        cls.form = Form.objects.create()
+        cls.root_message = Message.objects.create(
             direction=Message.DIRECTION_OUT,
             message_id=1,
-            chat=self.chat,
-            date=timezone.datetime(2000, 1, 1, tzinfo=timezone.utc),
+            chat=cls.chat,
+            date=JAN_1_2000,
             text="Question 1",
-            form=self.form,
+            form=cls.form,
         )
 
     def test_get_form_for_message(self):
@@ -290,7 +332,7 @@ class FormManagerTestCase(TestCase):
             direction=Message.DIRECTION_IN,
             message_id=2,
             chat=self.chat,
-            date=timezone.datetime(2000, 1, 1, 1, tzinfo=timezone.utc),
+            date=JAN_1_2000_1AM,
             text="Answer 1",
         )
         update = Update.objects.create(
@@ -302,6 +344,50 @@ class FormManagerTestCase(TestCase):
         form = Form.objects.get_form(update=update)
         self.assertEqual(form, self.form)
 
+    def test_get_form_for_message__single_query(self):
+        answer = Message.objects.create(
+            direction=Message.DIRECTION_IN,
+            message_id=2,
+            chat=self.chat,
+            date=JAN_1_2000_1AM,
+            text="Answer 1",
+        )
+        update = Update.objects.create(
+            bot=self.bot,
+            message=answer,
+            update_id="1",
+        )
+
+        with self.assertNumQueries(1):
+            form = Form.objects.get_form(update=update)
+            self.assertEqual(form.is_finished, False)
+
+    def test_get_form_for_message__no_previous_message(self):
+        update = Update.objects.create(
+            bot=self.bot,
+            message=self.root_message,
+            update_id="1",
+        )
+
+        self.assertIsNone(Form.objects.get_form(update=update))
+
+    def test_get_form_for_message__finished_form(self):
+        Form.objects.filter(pk=self.form.pk).update(is_finished=True)
+        answer = Message.objects.create(
+            direction=Message.DIRECTION_IN,
+            message_id=2,
+            chat=self.chat,
+            date=JAN_1_2000_1AM,
+            text="Answer 1",
+        )
+        update = Update.objects.create(
+            bot=self.bot,
+            message=answer,
+            update_id="1",
+        )
+
+        self.assertIsNone(Form.objects.get_form(update=update))
+
     def test_get_form_for_callback_query(self):
         callback_query = CallbackQuery.objects.create(
             bot=self.bot,
@@ -321,8 +407,9 @@ class FormManagerTestCase(TestCase):
 
 
 class MessageManagerTestCase(TestCase):
-    def setUp(self) -> None:
-        self.bot = Bot.objects.create(name="bot", token="token")
+    @classmethod
+    def setUpTestData(cls):
+        cls.bot = Bot.objects.create(name="bot", token="token")
 
     def test_from_telegram(self):
         animation = Animation(
@@ -337,7 +424,7 @@ class MessageManagerTestCase(TestCase):
         )
         telegram_message = TelegramMessage(
             message_id=42,
-            date=timezone.datetime(2000, 1, 1, tzinfo=timezone.utc),
+            date=JAN_1_2000,
             chat=TelegramChat(id=42, type="private"),
             from_user=TelegramUser(id=40, is_bot=False),
             animation=animation,
@@ -376,14 +463,14 @@ class MessageManagerTestCase(TestCase):
         chat = Chat.objects.create(bot=self.bot, chat_id=42, type="private")
         wanted = Message.objects.create(
             message_id=42,
-            date=timezone.datetime(2000, 1, 1, tzinfo=timezone.utc),
+            date=JAN_1_2000,
             chat=chat,
         )
 
         found = Message.objects.get_message(
             telegram_message=TelegramMessage(
                 message_id=wanted.message_id,
-                date=timezone.datetime(1999, 12, 31, tzinfo=timezone.utc),
+                date=DEC_31_1999,
                 chat=TelegramChat(id=chat.chat_id, type="private"),
             )
         )
@@ -394,14 +481,14 @@ class MessageManagerTestCase(TestCase):
         chat = Chat.objects.create(bot=self.bot, chat_id=42, type="private")
         wanted = Message.objects.create(
             message_id=42,
-            date=timezone.datetime(2000, 1, 1, tzinfo=timezone.utc),
+            date=JAN_1_2000,
             chat=chat,
         )
 
         found = Message.objects.get_message(
             telegram_message=TelegramMessage(
                 message_id=wanted.message_id,
-                date=timezone.datetime(1999, 12, 31, tzinfo=timezone.utc),
+                date=DEC_31_1999,
                 chat=TelegramChat(id=999, type="private"),
             )
         )
@@ -410,8 +497,9 @@ class MessageManagerTestCase(TestCase):
 
 
 class CallbackQueryManagerTestCase(TestCase):
-    def setUp(self) -> None:
-        self.bot = Bot.objects.create(name="name", token="token")
+    @classmethod
+    def setUpTestData(cls):
+        cls.bot = Bot.objects.create(name="name", token="token")
 
     def test_from_telegram(self):
         telegram_callback_query = TelegramCallbackQuery(
@@ -427,7 +515,7 @@ class CallbackQueryManagerTestCase(TestCase):
             ),
             message=TelegramMessage(
                 message_id=42,
-                date=timezone.datetime(2000, 1, 1, tzinfo=timezone.utc),
+                date=JAN_1_2000,
                 chat=TelegramChat(id=42, type="private"),
                 from_user=TelegramUser(id=40, is_bot=False),
             ),
@@ -448,7 +536,7 @@ class CallbackQueryManagerTestCase(TestCase):
         self.assertEqual(callback_query.text, "Data from button callback")
 
 
-class UpdateDefaultsTestCase(TestCase):
+class UpdateDefaultsTestCase(SimpleTestCase):
     class Something:
         some_attr = None
 
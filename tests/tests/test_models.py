@@ -2,7 +2,7 @@ from unittest.mock import Mock, call, patch
 
 from django.test import TestCase, override_settings
 from django.utils import timezone
-from factories.factories import UpdateFactory
+from factories.factories import FormFactory, MessageFactory, UpdateFactory
 
 from django_chatbot.models import Bot, Chat, Message, User
 from django_chatbot.telegram.api import Api, TelegramError
@@ -14,10 +14,32 @@ from django_chatbot.telegram.types import Update as TelegramUpdate
 from django_chatbot.telegram.types import User as TelegramUser
 from django_chatbot.telegram.types import WebhookInfo
 
+JAN_1_2000 = timezone.datetime(2000, 1, 1, tzinfo=timezone.utc)
+JAN_1_2000_1AM = timezone.datetime(2000, 1, 1, 1, tzinfo=timezone.utc)
+JAN_1_2000_2AM = timezone.datetime(2000, 1, 1, 2, tzinfo=timezone.utc)
+DEC_31_1999 = timezone.datetime(1999, 12, 31, tzinfo=timezone.utc)
+PRIVATE_CHAT = TelegramChat(id=142, type="private")
+YES_NO_MARKUP = InlineKeyboardMarkup(
+    inline_keyboard=[
+        [
+            InlineKeyboardButton("Yes", callback_data="yes"),
+            InlineKeyboardButton("No", callback_data="no"),
+        ]
+    ]
+)
+YES_AND_YES_MARKUP = InlineKeyboardMarkup(
+    inline_keyboard=[
+        [
+            InlineKeyboardButton("Yes and yes", callback_data="yes"),
+        ]
+    ]
+)
+
 
 class BotTestCase(TestCase):
-    def setUp(self) -> None:
-        self.bot = Bot.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.bot = Bot.objects.create(
             name="@TestBot",
             token="bot-token",
         )
@@ -335,23 +357,27 @@ class UserTestCase(TestCase):
 
     def test_chat(self):
         chat = Chat.objects.create(bot=self.bot, chat_id=1, type="private")
-        Message.objects.create(
-            message_id=1,
-            date=timezone.datetime(2000, 1, 1, tzinfo=timezone.utc),
-            chat=chat,
-            from_user=self.user,
-        )
-        Message.objects.create(
-            message_id=2,
-            date=timezone.datetime(2000, 1, 1, 1, tzinfo=timezone.utc),
-            chat=chat,
-            from_user=self.bot_user,
-        )
-        Message.objects.create(
-            message_id=3,
-            date=timezone.datetime(2000, 1, 1, 2, tzinfo=timezone.utc),
-            chat=chat,
-            from_user=self.user,
+        Message.objects.bulk_create(
+            [
+                Message(
+                    message_id=1,
+                    date=JAN_1_2000,
+                    chat=chat,
+                    from_user=self.user,
+                ),
+                Message(
+                    message_id=2,
+                    date=JAN_1_2000_1AM,
+                    chat=chat,
+                    from_user=self.bot_user,
+                ),
+                Message(
+                    message_id=3,
+                    date=JAN_1_2000_2AM,
+                    chat=chat,
+                    from_user=self.user,
+                ),
+            ]
         )
         another_chat = Chat.objects.create(
             bot=self.another_bot, chat_id=1, type="private"
@@ -362,12 +388,13 @@ class UserTestCase(TestCase):
 
 
 class ChatTestCase(TestCase):
-    def setUp(self) -> None:
+    @classmethod
+    def setUpTestData(cls):
         bot = Bot.objects.create(
             name="bot",
             token="token",
         )
-        self.chat = Chat.objects.create(
+        cls.chat = Chat.objects.create(
             bot=bot,
             chat_id=42,
             type="private",
@@ -406,6 +433,39 @@ class ChatTestCase(TestCase):
 
 
 class MessageTestCase(TestCase):
+    def test_str(self):
+        message = Message(message_id=1, text="The text longer than twenty chars")
+        media_message = Message(message_id=2, text=None)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(str(message), "The text longer than")
+            self.assertEqual(str(media_message), "")
+
+    def test_set_form(self):
+        message = MessageFactory()
+        form = FormFactory()
+
+        message.set_form(form)
+
+        message.refresh_from_db()
+        self.assertEqual(message.form, form)
+
+    def test_set_form__same_form__not_saved(self):
+        form = FormFactory()
+        message = MessageFactory(form=form)
+
+        with self.assertNumQueries(0):
+            message.set_form(form)
+
+    def test_set_form__saves_only_form(self):
+        message = MessageFactory()
+        form = FormFactory()
+
+        with patch.object(Message, "save") as mocked_save:
+            message.set_form(form)
+
+        mocked_save.assert_called_once_with(update_fields=["form"])
+
     def test_entities(self):
         message = Message(
             text="/start /help",
@@ -448,20 +508,20 @@ class MessageTestCase(TestCase):
         )
         incoming_message = Message.objects.create(
             message_id=42,
-            date=timezone.datetime(2000, 1, 1, tzinfo=timezone.utc),
+            date=JAN_1_2000,
             chat=chat,
         )
 
         mocked_send_message.return_value = TelegramMessage(
             message_id=43,
-            date=timezone.datetime(1999, 12, 31, tzinfo=timezone.utc),
+            date=DEC_31_1999,
             from_user=TelegramUser(id=1, is_bot=True),
-            chat=TelegramChat(id=142, type="private"),
+            chat=PRIVATE_CHAT,
             text="Reply",
             reply_to_message=TelegramMessage(
                 message_id=42,
-                chat=TelegramChat(id=142, type="private"),
-                date=timezone.datetime(2000, 1, 1, tzinfo=timezone.utc),
+                chat=PRIVATE_CHAT,
+                date=JAN_1_2000,
             ),
         )
 
@@ -482,9 +542,7 @@ class MessageTestCase(TestCase):
 
         self.assertEqual(message.direction, Message.DIRECTION_OUT)
         self.assertEqual(message.message_id, 43)
-        self.assertEqual(
-            message.date, timezone.datetime(1999, 12, 31, tzinfo=timezone.utc)
-        )
+        self.assertEqual(message.date, DEC_31_1999)
         self.assertEqual(message.chat, chat)
         self.assertEqual(message.from_user, user)
         self.assertEqual(message.reply_to_message, incoming_message)
@@ -494,21 +552,8 @@ class MessageTestCase(TestCase):
     def test_edit(self, mocked_edit_message_text: Mock):
         old_text = "old text"
         new_text = "new text"
-        old_markup = InlineKeyboardMarkup(
-            inline_keyboard=[
-                [
-                    InlineKeyboardButton("Yes", callback_data="yes"),
-                    InlineKeyboardButton("No", callback_data="no"),
-                ]
-            ]
-        )
-        new_markup = InlineKeyboardMarkup(
-            inline_keyboard=[
-                [
-                    InlineKeyboardButton("Yes and yes", callback_data="yes"),
-                ]
-            ]
-        )
+        old_markup = YES_NO_MARKUP
+        new_markup = YES_AND_YES_MARKUP
         bot = Bot.objects.create(
             name="bot",
             token="token",
@@ -520,15 +565,15 @@ class MessageTestCase(TestCase):
         )
         message = Message.objects.create(
             message_id=42,
-            date=timezone.datetime(1999, 12, 31, tzinfo=timezone.utc),
+            date=DEC_31_1999,
             chat=chat,
             text=old_text,
             _reply_markup=old_markup.to_dict(),
         )
         mocked_edit_message_text.return_value = TelegramMessage(
             message_id=42,
-            date=timezone.datetime(1999, 12, 31, tzinfo=timezone.utc),
-            chat=TelegramChat(id=142, type="private"),
+            date=DEC_31_1999,
+            chat=PRIVATE_CHAT,
             text=new_text,
             reply_markup=new_markup,
         )
@@ -555,21 +600,8 @@ class MessageTestCase(TestCase):
 
     @patch.object(Api, "edit_message_reply_markup")
     def test_edit_reply_markup(self, mocked_edit_message_reply_markup: Mock):
-        old_markup = InlineKeyboardMarkup(
-            inline_keyboard=[
-                [
-                    InlineKeyboardButton("Yes", callback_data="yes"),
-                    InlineKeyboardButton("No", callback_data="no"),
-                ]
-            ]
-        )
-        new_markup = InlineKeyboardMarkup(
-            inline_keyboard=[
-                [
-                    InlineKeyboardButton("Yes and yes", callback_data="yes"),
-                ]
-            ]
-        )
+        old_markup = YES_NO_MARKUP
+        new_markup = YES_AND_YES_MARKUP
         bot = Bot.objects.create(
             name="bot",
             token="token",
@@ -581,14 +613,14 @@ class MessageTestCase(TestCase):
         )
         message = Message.objects.create(
             message_id=42,
-            date=timezone.datetime(1999, 12, 31, tzinfo=timezone.utc),
+            date=DEC_31_1999,
             chat=chat,
             _reply_markup=old_markup.to_dict(),
         )
         mocked_edit_message_reply_markup.return_value = TelegramMessage(
             message_id=42,
-            date=timezone.datetime(1999, 12, 31, tzinfo=timezone.utc),
-            chat=TelegramChat(id=142, type="private"),
+            date=DEC_31_1999,
+            chat=PRIVATE_CHAT,
             reply_markup=new_markup,
         )
 
@@ -604,3 +636,20 @@ class MessageTestCase(TestCase):
 
         self.assertEqual(message.reply_markup, new_markup)
         self.assertEqual(message, returned)
+
+
+class UpdateTestCase(TestCase):
+    def test_set_handler__same_handler__not_saved(self):
+        update = UpdateFactory(handler="handler")
+
+        with self.assertNumQueries(0):
+            update.set_handler("handler")
+
+    def test_set_handler__saves_only_handler(self):
+        update = UpdateFactory(handler="handler")
+
+        with self.assertNumQueries(1):
+            update.set_handler("new_handler")
+
+        update.refresh_from_db()
+        self.assertEqual(update.handler, "new_handler")
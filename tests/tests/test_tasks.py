@@ -1,11 +1,11 @@
 from unittest.mock import Mock, patch
 
-from django.test import TestCase
+from django.test import SimpleTestCase
 
 from django_chatbot import tasks
 
 
-class DispatchTestCase(TestCase):
+class DispatchTestCase(SimpleTestCase):
     @patch("django_chatbot.tasks.Dispatcher")
     def test_task(self, mocked_dispatcher: Mock):
         update_data = {"key": "value"}
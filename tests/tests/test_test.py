@@ -31,15 +31,24 @@ from django_chatbot.models import Bot, CallbackQuery, Chat, Message, Update, Use
 from django_chatbot.telegram import types
 from django_chatbot.test.test import START_USER_ID, ClientResponse, ClientUser
 
+JAN_1_2000 = timezone.datetime(2000, 1, 1, tzinfo=timezone.utc)
+YES_NO_MARKUP = types.InlineKeyboardMarkup(
+    inline_keyboard=[
+        [types.InlineKeyboardButton("Yes", callback_data="yes")],
+        [types.InlineKeyboardButton("No", callback_data="no")],
+    ]
+)
+
 
 @patch("django_chatbot.test.test.Dispatcher")
 class ClientUserTestCase(TestCase):
-    def setUp(self) -> None:
-        self.bot = Bot.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.bot = Bot.objects.create(
             name="bot",
             token="token",
         )
-        self.another_bot = Bot.objects.create(
+        cls.another_bot = Bot.objects.create(
             name="another_bot",
             token="another_token",
         )
@@ -78,9 +87,13 @@ class ClientUserTestCase(TestCase):
         message_2_1 = Message.objects.create(
             message_id=9, chat=another_chat, date=now, text="message_2_1"
         )
-        Update.objects.create(update_id=7, bot=self.bot, message=message_1)
-        Update.objects.create(update_id=9, bot=self.bot, message=message_2_2)
-        Update.objects.create(update_id=8, bot=self.bot, message=message_2_1)
+        Update.objects.bulk_create(
+            [
+                Update(update_id=7, bot=self.bot, message=message_1),
+                Update(update_id=9, bot=self.bot, message=message_2_2),
+                Update(update_id=8, bot=self.bot, message=message_2_1),
+            ]
+        )
 
         self.assertEqual(mock_user._next_update_id(), 10)
 
@@ -93,14 +106,14 @@ class ClientUserTestCase(TestCase):
             type="private",
         )
         now = timezone.now()
-        Message.objects.create(
-            message_id=7, chat=mock_user.chat, date=now, text="message_1"
-        )
-        Message.objects.create(
-            message_id=8, chat=mock_user.chat, date=now, text="message_2_2"
-        )
-        Message.objects.create(
-            message_id=9, chat=another_chat, date=now, text="message_2_1"
+        Message.objects.bulk_create(
+            [
+                Message(message_id=7, chat=mock_user.chat, date=now, text="message_1"),
+                Message(
+                    message_id=8, chat=mock_user.chat, date=now, text="message_2_2"
+                ),
+                Message(message_id=9, chat=another_chat, date=now, text="message_2_1"),
+            ]
         )
 
         self.assertEqual(mock_user._next_message_id(), 9)
@@ -114,17 +127,21 @@ class ClientUserTestCase(TestCase):
         message_2 = Message.objects.create(
             message_id=8, chat=mock_user.chat, date=now, text="message_2"
         )
-        CallbackQuery.objects.create(
-            callback_query_id="22",
-            bot=self.bot,
-            from_user=mock_user.user,
-            message=message_1,
-        )
-        CallbackQuery.objects.create(
-            callback_query_id="23",
-            bot=self.bot,
-            from_user=mock_user.user,
-            message=message_2,
+        CallbackQuery.objects.bulk_create(
+            [
+                CallbackQuery(
+                    callback_query_id="22",
+                    bot=self.bot,
+                    from_user=mock_user.user,
+                    message=message_1,
+                ),
+                CallbackQuery(
+                    callback_query_id="23",
+                    bot=self.bot,
+                    from_user=mock_user.user,
+                    message=message_2,
+                ),
+            ]
         )
         self.assertEqual(mock_user._next_callback_query_id(), "24")
 
@@ -166,9 +183,9 @@ class ClientUserTestCase(TestCase):
             transform=lambda x: x,
         )
 
-    @patch("django_chatbot.test.test.timezone.now")
-    @patch.object(ClientUser, "_next_message_id")
-    @patch.object(ClientUser, "_next_update_id")
+    @patch("django_chatbot.test.test.timezone.now", return_value=JAN_1_2000)
+    @patch.object(ClientUser, "_next_message_id", return_value=42)
+    @patch.object(ClientUser, "_next_update_id", return_value=142)
     def test_send_message(
         self,
         mocked_next_update_id: Mock,
@@ -176,10 +193,7 @@ class ClientUserTestCase(TestCase):
         mocked_now: Mock,
         mocked_dispatcher: Mock,
     ):
-        now = timezone.datetime(2000, 1, 1, tzinfo=timezone.utc)
-        mocked_now.return_value = now
-        mocked_next_message_id.return_value = 42
-        mocked_next_update_id.return_value = 142
+        now = JAN_1_2000
         test_user = ClientUser(bot=self.bot, username="u")
 
         test_user.send_message("Help")
@@ -203,9 +217,9 @@ class ClientUserTestCase(TestCase):
             update_data=update_data
         )
 
-    @patch("django_chatbot.test.test.timezone.now")
-    @patch.object(ClientUser, "_next_message_id")
-    @patch.object(ClientUser, "_next_update_id")
+    @patch("django_chatbot.test.test.timezone.now", return_value=JAN_1_2000)
+    @patch.object(ClientUser, "_next_message_id", return_value=42)
+    @patch.object(ClientUser, "_next_update_id", return_value=142)
     def test_send_message__with_commands(
         self,
         mocked_next_update_id: Mock,
@@ -213,10 +227,7 @@ class ClientUserTestCase(TestCase):
         mocked_now: Mock,
         mocked_dispatcher: Mock,
     ):
-        now = timezone.datetime(2000, 1, 1, tzinfo=timezone.utc)
-        mocked_now.return_value = now
-        mocked_next_message_id.return_value = 42
-        mocked_next_update_id.return_value = 142
+        now = JAN_1_2000
         test_user = ClientUser(bot=self.bot, username="u")
 
         test_user.send_message("/start /help")
@@ -255,9 +266,9 @@ class ClientUserTestCase(TestCase):
         ]
         self.assertEqual(expected_entities, entities)
 
-    @patch("django_chatbot.test.test.timezone.now")
-    @patch.object(ClientUser, "_next_message_id")
-    @patch.object(ClientUser, "_next_update_id")
+    @patch("django_chatbot.test.test.timezone.now", return_value=JAN_1_2000)
+    @patch.object(ClientUser, "_next_message_id", return_value=42)
+    @patch.object(ClientUser, "_next_update_id", return_value=142)
     def test_send_callback_query(
         self,
         mocked_next_update_id: Mock,
@@ -265,22 +276,13 @@ class ClientUserTestCase(TestCase):
         mocked_now: Mock,
         mocked_dispatcher: Mock,
     ):
-        now = timezone.datetime(2000, 1, 1, tzinfo=timezone.utc)
-        mocked_now.return_value = now
-        mocked_next_message_id.return_value = 42
-        mocked_next_update_id.return_value = 142
         test_user = ClientUser(self.bot, username="u")
         message = Message.objects.create(
             chat=test_user.chat,
             date=timezone.now(),
             message_id=test_user._next_message_id(),
             text="Yes of No?",
-            _reply_markup=types.InlineKeyboardMarkup(
-                inline_keyboard=[
-                    [types.InlineKeyboardButton("Yes", callback_data="yes")],
-                    [types.InlineKeyboardButton("No", callback_data="no")],
-                ]
-            ).to_dict(),
+            _reply_markup=YES_NO_MARKUP.to_dict(),
         )
 
         test_user.send_callback_query(data="yes", markup_message=message)
@@ -308,9 +310,9 @@ class ClientUserTestCase(TestCase):
         update_data = update.to_dict(date_as_timestamp=True)
         test_user.dispatcher.dispatch.assert_called_with(update_data=update_data)
 
-    @patch("django_chatbot.test.test.timezone.now")
-    @patch.object(ClientUser, "_next_message_id")
-    @patch.object(ClientUser, "_next_update_id")
+    @patch("django_chatbot.test.test.timezone.now", return_value=JAN_1_2000)
+    @patch.object(ClientUser, "_next_message_id", return_value=42)
+    @patch.object(ClientUser, "_next_update_id", return_value=142)
     def test_send_callback_query_default_message(
         self,
         mocked_next_update_id: Mock,
@@ -318,22 +320,13 @@ class ClientUserTestCase(TestCase):
         mocked_now: Mock,
         mocked_dispatcher: Mock,
     ):
-        now = timezone.datetime(2000, 1, 1, tzinfo=timezone.utc)
-        mocked_now.return_value = now
-        mocked_next_message_id.return_value = 42
-        mocked_next_update_id.return_value = 142
         test_user = ClientUser(self.bot, username="u")
         message = Message.objects.create(
             chat=test_user.chat,
             date=timezone.now(),
             message_id=test_user._next_message_id(),
             text="Yes of No?",
-            _reply_markup=types.InlineKeyboardMarkup(
-                inline_keyboard=[
-                    [types.InlineKeyboardButton("Yes", callback_data="yes")],
-                    [types.InlineKeyboardButton("No", callback_data="no")],
-                ]
-            ).to_dict(),
+            _reply_markup=YES_NO_MARKUP.to_dict(),
         )
 
         test_user.send_callback_query(data="yes")
@@ -363,9 +356,39 @@ class ClientUserTestCase(TestCase):
 
 
 class ClientResponseTest(TestCase):
-    def setUp(self):
-        self.bot = BotFactory()
-        self.chat = ChatFactory(bot=self.bot)
+    @classmethod
+    def setUpTestData(cls):
+        cls.bot = BotFactory()
+        cls.chat = ChatFactory(bot=cls.bot)
+        # Messages and callback queries received in turn, shared by the
+        # tests of the response instances
+        cls.updates = [
+            UpdateFactory(bot=cls.bot, type=type_)
+            for type_ in (
+                "message",
+                "message",
+                "callback_query",
+                "callback_query",
+                "message",
+            )
+        ]
+        cls.changed_after = []
+        for update in cls.updates:
+            cls.changed_after.append(
+                {"model": "Update", "instance": update, "created": True}
+            )
+            if update.message is not None:
+                cls.changed_after.append(
+                    {"model": "Message", "instance": update.message, "created": True}
+                )
+            else:
+                cls.changed_after.append(
+                    {
+                        "model": "CallbackQuery",
+                        "instance": update.callback_query,
+                        "created": True,
+                    }
+                )
 
     def test_changed(self):
         update_1 = UpdateFactory(bot=self.bot)
@@ -422,35 +445,9 @@ class ClientResponseTest(TestCase):
         self.assertEqual(client_response.text, update.callback_query.data)
 
     def test_messages(self):
-        update_1 = UpdateFactory(bot=self.bot, type="message")
-        update_2 = UpdateFactory(bot=self.bot, type="message")
-        update_3 = UpdateFactory(bot=self.bot, type="callback_query")
-        update_4 = UpdateFactory(bot=self.bot, type="callback_query")
-        update_5 = UpdateFactory(bot=self.bot, type="message")
-
-        changed_before = []
-        changed_after = [
-            {"model": "Update", "instance": update_1, "created": True},
-            {"model": "Message", "instance": update_1.message, "created": True},
-            {"model": "Update", "instance": update_2, "created": True},
-            {"model": "Message", "instance": update_2.message, "created": True},
-            {"model": "Update", "instance": update_3, "created": True},
-            {
-                "model": "CallbackQuery",
-                "instance": update_3.callback_query,
-                "created": True,
-            },
-            {"model": "Update", "instance": update_4, "created": True},
-            {
-                "model": "CallbackQuery",
-                "instance": update_4.callback_query,
-                "created": True,
-            },
-            {"model": "Update", "instance": update_5, "created": True},
-            {"model": "Message", "instance": update_5.message, "created": True},
-        ]
+        update_1, update_2, update_3, update_4, update_5 = self.updates
 
-        client_response = ClientResponse(self.bot, changed_before, changed_after)
+        client_response = ClientResponse(self.bot, [], self.changed_after)
 
         self.assertEqual(
             client_response.messages,
@@ -458,68 +455,16 @@ class ClientResponseTest(TestCase):
         )
 
     def test_message(self):
-        update_1 = UpdateFactory(bot=self.bot, type="message")
-        update_2 = UpdateFactory(bot=self.bot, type="message")
-        update_3 = UpdateFactory(bot=self.bot, type="callback_query")
-        update_4 = UpdateFactory(bot=self.bot, type="callback_query")
-        update_5 = UpdateFactory(bot=self.bot, type="message")
-
-        changed_before = []
-        changed_after = [
-            {"model": "Update", "instance": update_1, "created": True},
-            {"model": "Message", "instance": update_1.message, "created": True},
-            {"model": "Update", "instance": update_2, "created": True},
-            {"model": "Message", "instance": update_2.message, "created": True},
-            {"model": "Update", "instance": update_3, "created": True},
-            {
-                "model": "CallbackQuery",
-                "instance": update_3.callback_query,
-                "created": True,
-            },
-            {"model": "Update", "instance": update_4, "created": True},
-            {
-                "model": "CallbackQuery",
-                "instance": update_4.callback_query,
-                "created": True,
-            },
-            {"model": "Update", "instance": update_5, "created": True},
-            {"model": "Message", "instance": update_5.message, "created": True},
-        ]
+        update_1, update_2, update_3, update_4, update_5 = self.updates
 
-        client_response = ClientResponse(self.bot, changed_before, changed_after)
+        client_response = ClientResponse(self.bot, [], self.changed_after)
 
         self.assertEqual(client_response.message, update_5.message)
 
     def test_callback_queries(self):
-        update_1 = UpdateFactory(bot=self.bot, type="message")
-        update_2 = UpdateFactory(bot=self.bot, type="message")
-        update_3 = UpdateFactory(bot=self.bot, type="callback_query")
-        update_4 = UpdateFactory(bot=self.bot, type="callback_query")
-        update_5 = UpdateFactory(bot=self.bot, type="message")
+        update_1, update_2, update_3, update_4, update_5 = self.updates
 
-        changed_before = []
-        changed_after = [
-            {"model": "Update", "instance": update_1, "created": True},
-            {"model": "Message", "instance": update_1.message, "created": True},
-            {"model": "Update", "instance": update_2, "created": True},
-            {"model": "Message", "instance": update_2.message, "created": True},
-            {"model": "Update", "instance": update_3, "created": True},
-            {
-                "model": "CallbackQuery",
-                "instance": update_3.callback_query,
-                "created": True,
-            },
-            {"model": "Update", "instance": update_4, "created": True},
-            {
-                "model": "CallbackQuery",
-                "instance": update_4.callback_query,
-                "created": True,
-            },
-            {"model": "Update", "instance": update_5, "created": True},
-            {"model": "Message", "instance": update_5.message, "created": True},
-        ]
-
-        client_response = ClientResponse(self.bot, changed_before, changed_after)
+        client_response = ClientResponse(self.bot, [], self.changed_after)
 
         self.assertEqual(
             client_response.callback_queries,
@@ -527,34 +472,8 @@ class ClientResponseTest(TestCase):
         )
 
     def test_callback_query(self):
-        update_1 = UpdateFactory(bot=self.bot, type="message")
-        update_2 = UpdateFactory(bot=self.bot, type="message")
-        update_3 = UpdateFactory(bot=self.bot, type="callback_query")
-        update_4 = UpdateFactory(bot=self.bot, type="callback_query")
-        update_5 = UpdateFactory(bot=self.bot, type="message")
-
-        changed_before = []
-        changed_after = [
-            {"model": "Update", "instance": update_1, "created": True},
-            {"model": "Message", "instance": update_1.message, "created": True},
-            {"model": "Update", "instance": update_2, "created": True},
-            {"model": "Message", "instance": update_2.message, "created": True},
-            {"model": "Update", "instance": update_3, "created": True},
-            {
-                "model": "CallbackQuery",
-                "instance": update_3.callback_query,
-                "created": True,
-            },
-            {"model": "Update", "instance": update_4, "created": True},
-            {
-                "model": "CallbackQuery",
-                "instance": update_4.callback_query,
-                "created": True,
-            },
-            {"model": "Update", "instance": update_5, "created": True},
-            {"model": "Message", "instance": update_5.message, "created": True},
-        ]
+        update_1, update_2, update_3, update_4, update_5 = self.updates
 
-        client_response = ClientResponse(self.bot, changed_before, changed_after)
+        client_response = ClientResponse(self.bot, [], self.changed_after)
 
         self.assertEqual(client_response.callback_query, update_4.callback_query)
@@ -1,10 +1,10 @@
 from unittest.mock import Mock, patch
 
-from django.test import TestCase
+from django.test import SimpleTestCase
 from django.urls import reverse
 
 
-class WebhookTestCase(TestCase):
+class WebhookTestCase(SimpleTestCase):
     @patch("django_chatbot.views.dispatch")
     def test_return_ok(self, mocked_dispatch: Mock):
         data = {"key": "value"}